@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+# Dump many lpch/gpch sets in one go, across a pool of worker processes,
+# so that interpreter startup and the ROMLOCS load are paid once per worker.
+
+import argparse
+import multiprocessing
+import multiprocessing.util
+import os
+import sys
+from os import path
+
+import lpch
+import namecache
+import parsecache
+
+
+parser = argparse.ArgumentParser(description='''
+    Dump many sets of lpch or gpch resources to annotated hexadecimal, one listing per set.
+    A directory argument holds one set per entry: a subdirectory of lpch files
+    (or holding one gpch), or a gpch file. A manifest file lists one set per line,
+    as whitespace-separated paths like the arguments to patch_rip.py.
+    A file in a set named names.txt is the linker's listing of its module names (as patch_rip.py -l),
+    and with -c the names learned from it are added to the module name cache for other sets.
+''')
+parser.add_argument('src', nargs='+', action='store', metavar='DIR|MANIFEST')
+parser.add_argument('-o', action='store', required=True, help='output directory for the listings')
+parser.add_argument('-c', action='store', help='module name cache (text, or SQLite if named *.sqlite)')
+parser.add_argument('--cache', action='store', metavar='DIR', help='directory to cache parsed resources in')
+parser.add_argument('-j', action='store', type=int, default=None, help='number of worker processes (default: one per CPU)')
+
+
+# Turn the arguments into a list of (listing name, [paths]). Empty subdirectories hold no set,
+# and are left out.
+def find_sets(srcs):
+    sets = []
+    for src in srcs:
+        if path.isdir(src):
+            for entry in sorted(os.listdir(src)):
+                entry = path.join(src, entry)
+                if path.isdir(entry):
+                    paths = sorted(path.join(entry, fn) for fn in os.listdir(entry))
+                    if paths: sets.append(paths)
+                else:
+                    sets.append([entry])
+        else:
+            with open(src) as f:
+                for l in f:
+                    l = l.split()
+                    if l and not l[0].startswith('#'):
+                        sets.append(l)
+
+    # Name each listing after the path that the set came from
+    named = []
+    taken = set()
+    for paths in sets:
+        name = path.commonpath(paths) if len(paths) > 1 else paths[0]
+        name = name.strip(os.sep).replace(os.sep, '_') or 'set'
+        while name in taken: name += '_'
+        taken.add(name)
+        named.append((name + '.txt', paths))
+
+    return named
+
+
+# Split the linker's listing of module names (names.txt) out of a set's paths
+def split_names(paths):
+    names = [p for p in paths if path.basename(p) == 'names.txt']
+    return [p for p in paths if p not in names], names[0] if names else None
+
+
+# Each worker process opens the module name cache once, and closes it on the way out
+_name_cache = None
+
+
+def init_worker(name_cache):
+    global _name_cache
+    if name_cache:
+        _name_cache = namecache.open_cache(name_cache)
+        multiprocessing.util.Finalize(None, _name_cache.close, exitpriority=10)
+
+
+def dump_one(job):
+    outpath, paths, cache_dir = job
+    try:
+        paths, names_path = split_names(paths)
+        resources = lpch.load_files(paths)
+        if cache_dir:
+            ps = parsecache.parse_lpch_set(resources, cache_dir)
+        else:
+            ps = lpch.parse_lpch_set(resources)
+
+        if _name_cache is not None:
+            ps.pq_cache = _name_cache
+        if names_path:
+            lpch.read_linker_names(ps, names_path)
+
+        with open(outpath, 'w') as f:
+            lpch.dump(ps, f)
+
+        # Share what the linker's names taught us with the other workers and later runs
+        if _name_cache is not None:
+            _name_cache.update(ps.learned_names())
+    except Exception as e:
+        if path.exists(outpath): os.remove(outpath)
+        return outpath, paths, '%s: %s' % (type(e).__name__, e)
+    return outpath, paths, None
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    os.makedirs(args.o, exist_ok=True)
+    jobs = [(path.join(args.o, name), paths, args.cache) for name, paths in find_sets(args.src)]
+
+    failures = []
+    pool = multiprocessing.Pool(args.j, initializer=init_worker, initargs=(args.c,))
+    for outpath, paths, err in pool.imap_unordered(dump_one, jobs):
+        if err:
+            failures.append((paths, err))
+    pool.close() # let the workers exit normally, closing their name caches
+    pool.join()
+
+    print('%d sets, %d failed' % (len(jobs), len(failures)), file=sys.stderr)
+    for paths, err in failures:
+        print('  %s: %s' % (' '.join(paths), err), file=sys.stderr)
+
+    sys.exit(1 if failures else 0)
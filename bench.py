@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+# Time each stage of patch_rip.py (load; the parser's passes over ROM fixups, the module map,
+# old routine references and hashes; naming; listing) and measure peak memory, over synthetic
+# patch sets of several sizes (see lpchwrite.py) and optionally a corpus of real ones.
+# Prints a table to stderr and JSON to stdout (or -o), for comparing runs.
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from os import path
+
+import batch_rip
+import lpch
+import lpchwrite
+from stats import Stats
+
+
+parser = argparse.ArgumentParser(description='''
+    Benchmark the lpch parser and listing, stage by stage.
+''')
+parser.add_argument('--corpus', action='append', default=[], metavar='DIR|MANIFEST', help='also time real patch sets, found as by batch_rip.py')
+parser.add_argument('--sizes', action='store', default='100,1000', help='module counts of the synthetic patch sets (default: %(default)s; 10000 takes minutes)')
+parser.add_argument('-n', action='store', type=int, default=5, help='runs of each, keeping the fastest (default: %(default)s)')
+parser.add_argument('-d', action='store_true', help='disassemble in the listing')
+parser.add_argument('-o', action='store', help='write the JSON results here instead of stdout')
+
+
+STAGES = ('load', 'rom fixups', 'module map', 'old refs', 'hashing', 'naming', 'listing')
+
+
+# One pass over a patch set, with each stage timed
+def run_once(paths, disasm):
+    st = Stats()
+    with st.stage('load'):
+        resources = lpch.load_files(paths)
+    ps = lpch.parse_lpch_set(resources, st)
+    with st.stage('listing'):
+        for line in lpch.listing(ps, disasm): pass
+    return st, ps
+
+
+def bench(name, paths, repeat, disasm):
+    best = {}
+    for i in range(repeat):
+        st, ps = run_once(paths, disasm)
+        total = sum(st.seconds.values())
+        if not best or total < best['seconds']:
+            best = dict(seconds=total, stages=dict(st.seconds))
+
+    # Separately, because tracing every allocation slows everything down
+    tracemalloc.start()
+    run_once(paths, disasm)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return dict(
+        name=name,
+        bytes=sum(len(data) for data in ps.resources.values()),
+        modules=len(ps.modtable),
+        seconds=best['seconds'],
+        stages={stage: best['stages'].get(stage, 0.0) for stage in STAGES},
+        peak_bytes=peak,
+    )
+
+
+def print_table(results, file):
+    print('%-24s %8s %9s ' % ('set', 'modules', 'ms') + ' '.join('%10s' % s for s in STAGES) + ' %9s' % 'peak KiB', file=file)
+    for r in results:
+        print('%-24s %8d %9.1f ' % (r['name'][-24:], r['modules'], r['seconds']*1e3) +
+            ' '.join('%10.1f' % (r['stages'][s]*1e3) for s in STAGES) +
+            ' %9d' % (r['peak_bytes'] >> 10), file=file)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for nmodules in [int(n) for n in args.sizes.split(',') if n]:
+            gpch_path = path.join(tmp, 'synthetic%d' % nmodules)
+            with open(gpch_path, 'wb') as f:
+                f.write(lpchwrite.encode_gpch(lpchwrite.encode_set(lpchwrite.synth(nmodules))))
+            results.append(bench('synthetic%d' % nmodules, [gpch_path], args.n, args.d))
+
+        for name, paths in batch_rip.find_sets(args.corpus):
+            try:
+                results.append(bench(name[:-len('.txt')], batch_rip.split_names(paths)[0], args.n, args.d))
+            except Exception as e:
+                print('skipping %s: %s: %s' % (' '.join(paths), type(e).__name__, e), file=sys.stderr)
+
+    print_table(results, sys.stderr)
+
+    report = dict(
+        python=platform.python_version(),
+        machine=platform.machine(),
+        time=time.strftime('%Y-%m-%dT%H:%M:%S'),
+        repeat=args.n,
+        disasm=args.d,
+        results=results,
+    )
+    if args.o:
+        with open(args.o, 'w') as f:
+            json.dump(report, f, indent=1)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+        print()
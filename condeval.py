@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+# What a patch set installs on each of many machine configurations (a ROM plus the conditions
+# that hold, like IIci with notVM and using32BitHeaps), worked out for all of them at once.
+#
+# Configurations are numbered, and a set of them is an int with bit i for configuration i.
+# Each condition becomes the set of configurations where it holds, each export's condition
+# bits become the set where it applies (the ROMs or'ed, the other conditions and'ed, as in
+# link.py), and each module the set where it is installed. So the work goes with the number of
+# distinct condition bitfields and modules, not with the number of configurations.
+#
+# A module is installed where it exports something that applies, or where an installed module
+# refers to it. It stays resident after boot where it patches a trap (rather than only running
+# an InstallProc), or where a resident module refers to it with a Resident reference.
+
+import argparse
+import itertools
+from collections import defaultdict, namedtuple
+
+import lpch
+from lpch import bits
+
+
+Config = namedtuple('Config', 'rom conds')
+
+# installed[mjt], resident[mjt] and traps[trap] are sets of configurations, as ints
+Evaluation = namedtuple('Evaluation', 'configs installed resident traps')
+
+
+# Every ROM of the patch set with every combination of these conditions
+def all_configs(ps, conds):
+    configs = []
+    for rom in ps.condnames[:ps.nroms]:
+        for n in range(len(conds) + 1):
+            for combo in itertools.combinations(conds, n):
+                configs.append(Config(rom, frozenset(combo)))
+    return configs
+
+
+def evaluate(ps, configs):
+    everyone = (1 << len(configs)) - 1
+
+    # holds[b] = where condition bit b holds
+    holds = [0] * len(ps.condnames)
+    for i, config in enumerate(configs):
+        holds[ps.condnames.index(config.rom)] |= 1 << i
+        for cond in config.conds:
+            holds[ps.condnames.index(cond)] |= 1 << i
+
+    applies = {} # applies[condbits] = where an export with those bits applies
+    def where(condbits):
+        if condbits not in applies:
+            roms, conds = 0, everyone
+            for b in bits(condbits):
+                if b < ps.nroms: roms |= holds[b]
+                else: conds &= holds[b]
+            applies[condbits] = roms & conds
+        return applies[condbits]
+
+    available = {mjt: where(mod.num) for mjt, mod in ps.modtable.items()}
+    owner = {mjt + i: mjt for mjt, mod in ps.modtable.items() for i in range(1 + len(mod.ents))}
+
+    installed = defaultdict(int)
+    resident = defaultdict(int)
+    traps = defaultdict(int)
+    for jt, exports in ps.jtpatches.items():
+        if jt not in owner: continue
+        mjt = owner[jt]
+        for trap, condbits in exports:
+            w = where(condbits) & available[mjt]
+            installed[mjt] |= w
+            if trap:
+                resident[mjt] |= w
+                traps[trap] |= w
+
+    # Spread each set along the references, until nothing more is reached
+    for reached, resident_only in ((installed, False), (resident, True)):
+        todo = list(reached)
+        while todo:
+            mjt = todo.pop()
+            for _, _, _, is_resident, targ_jt in ps.modtable[mjt].coderefs:
+                if resident_only and not is_resident: continue
+                targ = owner.get(targ_jt)
+                if targ is None: continue
+                more = reached[mjt] & available[targ] & ~reached[targ]
+                if more:
+                    reached[targ] |= more
+                    todo.append(targ)
+
+    return Evaluation(configs, dict(installed), dict(resident), dict(traps))
+
+
+# The modules installed in configuration i
+def installed_modules(ev, i):
+    return sorted(mjt for mjt, w in ev.installed.items() if w >> i & 1)
+
+
+# The traps patched in configuration i
+def patched_traps(ev, i):
+    return sorted(trap for trap, w in ev.traps.items() if w >> i & 1)
+
+
+# Total size of the modules in each configuration, as a list indexed by configuration.
+# Modules installed in the same configurations are added up first.
+def code_sizes(ps, sets, nconfigs):
+    by_set = defaultdict(int)
+    for mjt, w in sets.items():
+        mod = ps.modtable[mjt]
+        by_set[w] += mod.end - mod.ofs
+    return [sum(size for w, size in by_set.items() if w >> i & 1) for i in range(nconfigs)]
+
+
+def _configstr(config):
+    return ','.join([config.rom] + sorted(config.conds))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='''
+        What a patch set installs on each of many machine configurations:
+        how many modules, how many traps patched, and how much code, in all and after boot.
+    ''')
+    parser.add_argument('src', nargs='+', action='store', metavar='[System | System//lpch | System//gpch/N]')
+    parser.add_argument('--gpch', action='store', type=int, metavar='N', help='which gpch of a System file')
+    parser.add_argument('--conds', action='store', default='', metavar='COND,...', help='every ROM with every combination of these conditions')
+    parser.add_argument('--config', action='append', default=[], metavar='ROM,COND,...', help='one configuration (repeatable), instead of --conds')
+    parser.add_argument('--modules', action='store_true', help='list the modules and traps of each configuration too')
+    args = parser.parse_args()
+
+    ps = lpch.parse_files(args.src, args.gpch)
+
+    if args.config:
+        configs = [Config(c.split(',')[0], frozenset(c.split(',')[1:])) for c in args.config]
+    else:
+        configs = all_configs(ps, [c for c in args.conds.split(',') if c])
+    for config in configs:
+        for name in [config.rom, *config.conds]:
+            if name not in ps.condnames or (name == config.rom) != (ps.condnames.index(name) < ps.nroms):
+                parser.error('not a %s of this patch set: %s' % ('ROM' if name == config.rom else 'condition', name))
+
+    ev = evaluate(ps, configs)
+    installed_sizes = code_sizes(ps, ev.installed, len(configs))
+    resident_sizes = code_sizes(ps, ev.resident, len(configs))
+
+    print('%7s %6s %10s %10s  %s' % ('modules', 'traps', 'installed', 'resident', 'configuration'))
+    for i, config in enumerate(configs):
+        mods = installed_modules(ev, i)
+        traps = patched_traps(ev, i)
+        print('%7d %6d %10d %10d  %s' % (len(mods), len(traps), installed_sizes[i], resident_sizes[i], _configstr(config)))
+        if args.modules:
+            print('    modules: ' + ' '.join(ps.getname(mjt) for mjt in mods))
+            print('    traps: ' + ' '.join('$%X' % trap for trap in traps))
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+
+# A persistent SQLite index over many parsed patch sets (System versions), for questions like
+# "which patch modules, in which Systems, call ROM address X on the IIci?" or "who patches
+# trap $A9A0, and under which conditions?" without re-dumping the corpus.
+#
+# Each patch set is added under a label (its System version, say), replacing anything previously
+# added under that label. Every ROM reference is indexed by (ROM, address), one row per ROM.
+# Every PatchProc and InstallProc is indexed by trap (0 for InstallProc), and its conditions
+# by name, one row per condition.
+
+import argparse
+import sqlite3
+import sys
+
+import batch_rip
+import lpch
+import namecache
+import romlocs
+
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS systems (
+    id INTEGER PRIMARY KEY,
+    label TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS romrefs (
+    system INTEGER NOT NULL REFERENCES systems(id),
+    rom TEXT NOT NULL,
+    addr INTEGER NOT NULL,
+    symbol TEXT,
+    macro TEXT NOT NULL,
+    module_jt INTEGER NOT NULL,
+    module_name TEXT NOT NULL,
+    module_hash INTEGER,
+    ofs INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS romrefs_by_addr ON romrefs (rom, addr);
+CREATE INDEX IF NOT EXISTS romrefs_by_system ON romrefs (system);
+CREATE TABLE IF NOT EXISTS patches (
+    id INTEGER PRIMARY KEY,
+    system INTEGER NOT NULL REFERENCES systems(id),
+    trap INTEGER NOT NULL,
+    conds TEXT NOT NULL,
+    jt INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    module_jt INTEGER NOT NULL,
+    module_name TEXT NOT NULL,
+    module_hash INTEGER
+);
+CREATE INDEX IF NOT EXISTS patches_by_trap ON patches (trap);
+CREATE INDEX IF NOT EXISTS patches_by_system ON patches (system);
+CREATE TABLE IF NOT EXISTS patch_conds (
+    patch INTEGER NOT NULL REFERENCES patches(id),
+    cond TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS patch_conds_by_cond ON patch_conds (cond, patch);
+'''
+
+
+class CorpusIndex:
+    def __init__(self, path):
+        self.db = sqlite3.connect(path, timeout=60)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.executescript(SCHEMA)
+        self.db.commit()
+
+    def add(self, label, ps):
+        with self.db:
+            system = self._replace_system(label)
+            self.db.executemany('INSERT INTO romrefs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', self._romref_rows(system, ps))
+            for row, conds in self._patch_rows(system, ps):
+                patch = self.db.execute('INSERT INTO patches VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, ?)', row).lastrowid
+                self.db.executemany('INSERT INTO patch_conds VALUES (?, ?)', ((patch, cond) for cond in conds))
+
+    # Drop whatever was indexed under this label, and return a fresh id for it
+    def _replace_system(self, label):
+        row = self.db.execute('SELECT id FROM systems WHERE label = ?', (label,)).fetchone()
+        if row:
+            self.db.execute('DELETE FROM romrefs WHERE system = ?', row)
+            self.db.execute('DELETE FROM patch_conds WHERE patch IN (SELECT id FROM patches WHERE system = ?)', row)
+            self.db.execute('DELETE FROM patches WHERE system = ?', row)
+            self.db.execute('DELETE FROM systems WHERE id = ?', row)
+        return self.db.execute('INSERT INTO systems (label) VALUES (?)', (label,)).lastrowid
+
+    def _romref_rows(self, system, ps):
+        for mjt, mod in sorted(ps.modtable.items()):
+            name = ps.getname(mjt)
+            hashcrc = ps.namedb.get(mjt, [None, None, None])[2]
+            for ofs, _, macroname, romaddrs, _ in mod.romrefs:
+                for rom, addr in zip(ps.condnames, romaddrs):
+                    if addr is not None:
+                        yield (system, rom, addr, romlocs.lookup(rom, addr) or None, macroname, mjt, name, hashcrc, ofs)
+
+    def _patch_rows(self, system, ps):
+        for mjt, mod in sorted(ps.modtable.items()):
+            name = ps.getname(mjt)
+            hashcrc = ps.namedb.get(mjt, [None, None, None])[2]
+            for jt in range(mjt, mjt + 1 + len(mod.ents)):
+                for trap, condbits in ps.jtpatches.get(jt, ()):
+                    conds = [ps.condnames[b] for b in lpch.bits(condbits)]
+                    yield (system, trap, ','.join(conds), jt, ps.getname(jt), mjt, name, hashcrc), conds
+
+    def labels(self):
+        return [label for label, in self.db.execute('SELECT label FROM systems ORDER BY label')]
+
+    # References to one ROM address, or to any in lo <= addr <= hi
+    def rom_refs(self, rom, lo, hi=None):
+        return self.db.execute('''
+            SELECT label, rom, addr, symbol, macro, module_jt, module_name, module_hash, ofs
+            FROM romrefs JOIN systems ON systems.id = romrefs.system
+            WHERE rom = ? AND addr BETWEEN ? AND ?
+            ORDER BY addr, label, module_jt, ofs
+        ''', (rom, lo, lo if hi is None else hi)).fetchall()
+
+    # PatchProcs and InstallProcs (trap 0), optionally only those of one trap,
+    # under one condition, or in one set
+    def patches(self, trap=None, cond=None, label=None):
+        where, params = [], []
+        if trap is not None:
+            where.append('trap = ?')
+            params.append(trap)
+        if cond is not None:
+            where.append('patches.id IN (SELECT patch FROM patch_conds WHERE cond = ?)')
+            params.append(cond)
+        if label is not None:
+            where.append('label = ?')
+            params.append(label)
+
+        return self.db.execute('''
+            SELECT label, trap, conds, jt, name, module_jt, module_name, module_hash
+            FROM patches JOIN systems ON systems.id = patches.system
+            %s
+            ORDER BY trap, label, jt
+        ''' % ('WHERE ' + ' AND '.join(where) if where else ''), params).fetchall()
+
+    def close(self):
+        self.db.close()
+
+
+# '$40a0', '0x40a0' or '40a0', or a range like '40a0-40ff'
+def _addr_range(s):
+    lo, _, hi = s.partition('-')
+    lo = int(lo.strip().lstrip('$'), 16)
+    return lo, int(hi.strip().lstrip('$'), 16) if hi else lo
+
+
+def _hash(crc):
+    return '--------' if crc is None else '%08x' % crc
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='''
+        Keep an index of the ROM references and patches of many patch sets, and look up
+        which modules, in which sets, refer to a ROM address or range of addresses,
+        or install a PatchProc or InstallProc, by trap, condition or set.
+    ''')
+    parser.add_argument('db', action='store', metavar='DB', help='SQLite index file (created if need be)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('add', help='parse sets and add them to the index, each labelled with its name as in batch_rip.py')
+    p.add_argument('src', nargs='+', action='store', metavar='DIR|MANIFEST')
+    p.add_argument('-c', action='store', help='module name cache (text, or SQLite if named *.sqlite)')
+
+    p = sub.add_parser('rom', help='modules referring to a ROM address')
+    p.add_argument('rom', action='store', metavar='ROM', help='ROM name, like IIci')
+    p.add_argument('addr', action='store', metavar='ADDR[-ADDR]', help='hex address or inclusive range')
+
+    p = sub.add_parser('traps', help='PatchProcs and InstallProcs, by trap, condition or set')
+    p.add_argument('trap', nargs='?', action='store', metavar='TRAP', help='hex trap number, or 0 for InstallProcs')
+    p.add_argument('--cond', action='store', help='only those installed under this condition, like IIci or notVM')
+    p.add_argument('--label', action='store', help='only those of this set')
+
+    args = parser.parse_args()
+    index = CorpusIndex(args.db)
+
+    if args.command == 'add':
+        pq_cache = namecache.open_cache(args.c) if args.c else None
+        failures = 0
+        for name, paths in batch_rip.find_sets(args.src):
+            label = name[:-len('.txt')]
+            paths, names_path = batch_rip.split_names(paths)
+            try:
+                ps = lpch.parse_files(paths)
+            except Exception as e:
+                print('%s: %s: %s' % (label, type(e).__name__, e), file=sys.stderr)
+                failures += 1
+                continue
+            if pq_cache is not None:
+                ps.pq_cache = pq_cache
+            if names_path:
+                lpch.read_linker_names(ps, names_path)
+            index.add(label, ps)
+            print(label, file=sys.stderr)
+        if pq_cache is not None:
+            pq_cache.close()
+        index.close()
+        sys.exit(1 if failures else 0)
+
+    elif args.command == 'rom':
+        lo, hi = _addr_range(args.addr)
+        for label, rom, addr, symbol, macro, mjt, mname, crc, ofs in index.rom_refs(args.rom, lo, hi):
+            print('%s $%x %-24s %-10s %s %s (%03X) +%x %s' % (rom, addr, symbol or '', macro, _hash(crc), mname, mjt, ofs, label))
+        index.close()
+
+    elif args.command == 'traps':
+        trap = int(args.trap.lstrip('$'), 16) if args.trap is not None else None
+        for label, trap, conds, jt, name, mjt, mname, crc in index.patches(trap, args.cond, args.label):
+            proc = 'PatchProc $%X' % trap if trap else 'InstallProc'
+            print('%-16s (%s) %s (%03X) in %s %s (%03X) %s' % (proc, conds, name, jt, _hash(crc), mname, mjt, label))
+        index.close()
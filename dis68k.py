@@ -0,0 +1,554 @@
+# A table-driven disassembler for the 68000, plus the few 68020 instructions common in patches.
+# Every possible opcode word indexes a 64K-entry table of decoders, built once on first use,
+# so decoding costs one table lookup per instruction instead of a chain of bit tests.
+#
+# The syntax is Motorola's, lower case to match the listing. Branch targets and PC-relative
+# operands are shown relative to the start of the instruction, like "bra.s *+$12".
+
+import struct
+
+
+CONDS = ['t', 'f', 'hi', 'ls', 'cc', 'cs', 'ne', 'eq', 'vc', 'vs', 'pl', 'mi', 'ge', 'lt', 'gt', 'le']
+SIZES = ['b', 'w', 'l']
+AREGS = ['a0', 'a1', 'a2', 'a3', 'a4', 'a5', 'a6', 'sp']
+
+
+# Classes of effective address, as sets of "EA numbers":
+# 0 Dn, 1 An, 2 (An), 3 (An)+, 4 -(An), 5 d16(An), 6 d8(An,Xn),
+# 7 abs.w, 8 abs.l, 9 d16(PC), 10 d8(PC,Xn), 11 #imm
+EA_ALL = frozenset(range(12))
+EA_DATA = EA_ALL - {1}
+EA_ALT = frozenset(range(9))
+EA_DALT = EA_ALT - {1}
+EA_MALT = EA_ALT - {0, 1}
+EA_CTRL = frozenset({2, 5, 6, 7, 8, 9, 10})
+EA_CALT = frozenset({2, 5, 6, 7, 8})
+
+
+def eanum(mode, reg):
+    if mode < 7: return mode
+    if reg <= 4: return 7 + reg
+    return None
+
+
+class BadOpcode(Exception):
+    pass
+
+
+# Fetches extension words for one instruction
+class Reader:
+    def __init__(self, code, pc, end):
+        self.code = code
+        self.pc = pc # start of the instruction
+        self.pos = pc + 2 # past the opcode word
+        self.end = end
+
+    def word(self):
+        if self.pos + 2 > self.end: raise BadOpcode
+        w, = struct.unpack_from('>H', self.code, self.pos); self.pos += 2
+        return w
+
+    def sword(self):
+        w = self.word()
+        return w - 0x10000 if w & 0x8000 else w
+
+    def long(self):
+        if self.pos + 4 > self.end: raise BadOpcode
+        l, = struct.unpack_from('>L', self.code, self.pos); self.pos += 4
+        return l
+
+    def slong(self):
+        l = self.long()
+        return l - 0x100000000 if l & 0x80000000 else l
+
+
+def signedhex(n):
+    return '-$%x' % -n if n < 0 else '$%x' % n
+
+
+def relative(n):
+    return '*-$%x' % -n if n < 0 else '*+$%x' % n
+
+
+def imm(r, size):
+    if size == 'b': return '#$%x' % (r.word() & 0xff)
+    if size == 'w': return '#$%x' % r.word()
+    return '#$%x' % r.long()
+
+
+# Brief extension word: d8(An,Xn.s*scale), or for the PC, relative to the extension word at 'at'
+def index(r, base, at=None):
+    ext = r.word()
+    if ext & 0x100: raise BadOpcode # 68020 full extension word
+    xn = (AREGS if ext & 0x8000 else ['d%d' % i for i in range(8)])[(ext >> 12) & 7]
+    xsize = '.l' if ext & 0x800 else '.w'
+    scale = (ext >> 9) & 3
+    scale = '*%d' % (1 << scale) if scale else ''
+    disp = ext & 0xff
+    if disp & 0x80: disp -= 0x100
+    disp = signedhex(disp) if at is None else relative(at + disp)
+    return '%s(%s,%s%s%s)' % (disp, base, xn, xsize, scale)
+
+
+# Decode an effective address field, reading any extension words
+def ea(r, mode, reg, size='w'):
+    if mode == 0: return 'd%d' % reg
+    if mode == 1: return AREGS[reg]
+    if mode == 2: return '(%s)' % AREGS[reg]
+    if mode == 3: return '(%s)+' % AREGS[reg]
+    if mode == 4: return '-(%s)' % AREGS[reg]
+    if mode == 5: return '%s(%s)' % (signedhex(r.sword()), AREGS[reg])
+    if mode == 6: return index(r, AREGS[reg])
+    if reg == 0: return '$%x.w' % r.word()
+    if reg == 1: return '$%x' % r.long()
+    if reg == 2:
+        at = r.pos - r.pc
+        return '%s(pc)' % relative(at + r.sword())
+    if reg == 3: return index(r, 'pc', at=r.pos - r.pc)
+    if reg == 4: return imm(r, size)
+    raise BadOpcode
+
+
+def low_ea(r, op, size='w'):
+    return ea(r, (op >> 3) & 7, op & 7, size)
+
+
+# Register list for movem, in the usual d0-d3/a0 form
+def reglist(mask, predec):
+    if predec: mask = int('{:016b}'.format(mask)[::-1], 2)
+    names = ['d%d' % i for i in range(8)] + ['a%d' % i for i in range(8)]
+    parts = []
+    i = 0
+    while i < 16:
+        if mask & (1 << i):
+            j = i
+            while j + 1 < 16 and (j + 1) % 8 and mask & (1 << (j + 1)): j += 1
+            parts.append(names[i] if i == j else '%s-%s' % (names[i], names[j]))
+            i = j + 1
+        else:
+            i += 1
+    return '/'.join(parts).replace('a7', 'sp') or '0'
+
+
+# Each decoder takes the opcode word and a Reader, and returns the instruction text
+
+def d_fixed(text):
+    return lambda op, r: text
+
+
+def d_to_ccr_sr(name):
+    def decode(op, r):
+        if op & 0x40: return '%s #$%x,sr' % (name, r.word())
+        return '%s #$%x,ccr' % (name, r.word() & 0xff)
+    return decode
+
+
+def d_immediate(name):
+    def decode(op, r):
+        size = (op >> 6) & 3
+        if size == 3: raise BadOpcode
+        size = SIZES[size]
+        src = imm(r, size)
+        return '%s.%s %s,%s' % (name, size, src, low_ea(r, op, size))
+    return decode
+
+
+def d_bitop_dynamic(op, r):
+    name = ['btst', 'bchg', 'bclr', 'bset'][(op >> 6) & 3]
+    return '%s d%d,%s' % (name, (op >> 9) & 7, low_ea(r, op, 'b'))
+
+
+def d_bitop_static(op, r):
+    name = ['btst', 'bchg', 'bclr', 'bset'][(op >> 6) & 3]
+    bit = r.word() & 0xff
+    return '%s #%d,%s' % (name, bit, low_ea(r, op, 'b'))
+
+
+def d_movep(op, r):
+    dn = 'd%d' % ((op >> 9) & 7)
+    size = 'l' if op & 0x40 else 'w'
+    mem = '%s(%s)' % (signedhex(r.sword()), AREGS[op & 7])
+    if op & 0x80: return 'movep.%s %s,%s' % (size, dn, mem)
+    return 'movep.%s %s,%s' % (size, mem, dn)
+
+
+def d_move(op, r):
+    size = {1: 'b', 3: 'w', 2: 'l'}.get((op >> 12) & 3)
+    if size is None: raise BadOpcode
+    if size == 'b' and (op >> 3) & 7 == 1: raise BadOpcode
+    dmode, dreg = (op >> 6) & 7, (op >> 9) & 7
+    if eanum(dmode, dreg) not in EA_DALT: raise BadOpcode
+    src = low_ea(r, op, size)
+    return 'move.%s %s,%s' % (size, src, ea(r, dmode, dreg, size))
+
+
+def d_movea(op, r):
+    size = {3: 'w', 2: 'l'}.get((op >> 12) & 3)
+    if size is None: raise BadOpcode
+    return 'movea.%s %s,%s' % (size, low_ea(r, op, size), AREGS[(op >> 9) & 7])
+
+
+def d_unary(name):
+    def decode(op, r):
+        size = (op >> 6) & 3
+        if size == 3: raise BadOpcode
+        size = SIZES[size]
+        return '%s.%s %s' % (name, size, low_ea(r, op, size))
+    return decode
+
+
+def d_tst(op, r):
+    size = (op >> 6) & 3
+    if size == 3: raise BadOpcode
+    size = SIZES[size]
+    if size == 'b' and (op >> 3) & 7 == 1: raise BadOpcode
+    return 'tst.%s %s' % (size, low_ea(r, op, size))
+
+
+def d_ea_only(name, size='w'):
+    return lambda op, r: '%s %s' % (name, low_ea(r, op, size))
+
+
+def d_move_sr(direction):
+    def decode(op, r):
+        if direction == 'from sr': return 'move.w sr,%s' % low_ea(r, op)
+        if direction == 'to ccr': return 'move.w %s,ccr' % low_ea(r, op)
+        return 'move.w %s,sr' % low_ea(r, op)
+    return decode
+
+
+def d_reg(fmt, areg=False):
+    return lambda op, r: fmt % (AREGS[op & 7] if areg else 'd%d' % (op & 7))
+
+
+def d_movem(op, r):
+    size = 'l' if op & 0x40 else 'w'
+    mask = r.word()
+    predec = (op >> 3) & 7 == 4
+    where = low_ea(r, op, size)
+    regs = reglist(mask, predec)
+    if op & 0x400: return 'movem.%s %s,%s' % (size, where, regs)
+    return 'movem.%s %s,%s' % (size, regs, where)
+
+
+def d_trap(op, r):
+    return 'trap #%d' % (op & 15)
+
+
+def d_link(op, r):
+    return 'link %s,#%s' % (AREGS[op & 7], signedhex(r.sword()))
+
+
+def d_link_l(op, r):
+    return 'link.l %s,#%s' % (AREGS[op & 7], signedhex(r.slong()))
+
+
+def d_usp(op, r):
+    if op & 8: return 'move.l usp,%s' % AREGS[op & 7]
+    return 'move.l %s,usp' % AREGS[op & 7]
+
+
+def d_word_operand(fmt):
+    return lambda op, r: fmt % r.word()
+
+
+CONTROL_REGS = {0x000: 'sfc', 0x001: 'dfc', 0x002: 'cacr', 0x800: 'usp', 0x801: 'vbr', 0x802: 'caar', 0x803: 'msp', 0x804: 'isp'}
+
+
+def d_movec(op, r):
+    ext = r.word()
+    ctrl = CONTROL_REGS.get(ext & 0xfff)
+    if ctrl is None: raise BadOpcode
+    rn = (AREGS if ext & 0x8000 else ['d%d' % i for i in range(8)])[(ext >> 12) & 7]
+    if op & 1: return 'movec %s,%s' % (rn, ctrl)
+    return 'movec %s,%s' % (ctrl, rn)
+
+
+def d_lea(op, r):
+    return 'lea %s,%s' % (low_ea(r, op, 'l'), AREGS[(op >> 9) & 7])
+
+
+def d_chk(op, r):
+    return 'chk.w %s,d%d' % (low_ea(r, op), (op >> 9) & 7)
+
+
+def d_dbcc(op, r):
+    cond = CONDS[(op >> 8) & 15]
+    cond = 'ra' if cond == 'f' else cond
+    return 'db%s d%d,%s' % (cond, op & 7, relative(2 + r.sword()))
+
+
+def d_scc(op, r):
+    return 's%s %s' % (CONDS[(op >> 8) & 15], low_ea(r, op, 'b'))
+
+
+def d_quick(name):
+    def decode(op, r):
+        size = (op >> 6) & 3
+        if size == 3: raise BadOpcode
+        size = SIZES[size]
+        if size == 'b' and (op >> 3) & 7 == 1: raise BadOpcode
+        data = (op >> 9) & 7 or 8
+        return '%s.%s #%d,%s' % (name, size, data, low_ea(r, op, size))
+    return decode
+
+
+def d_branch(op, r):
+    cond = (op >> 8) & 15
+    name = 'b' + ('ra', 'sr')[cond] if cond < 2 else 'b' + CONDS[cond]
+    disp = op & 0xff
+    if disp == 0:
+        return '%s %s' % (name, relative(2 + r.sword()))
+    if disp == 0xff:
+        return '%s.l %s' % (name, relative(2 + r.slong()))
+    if disp & 0x80: disp -= 0x100
+    return '%s.s %s' % (name, relative(2 + disp))
+
+
+def d_moveq(op, r):
+    data = op & 0xff
+    if data & 0x80: data -= 0x100
+    return 'moveq #%d,d%d' % (data, (op >> 9) & 7)
+
+
+# OR, SUB, CMP, EOR, AND, ADD with a data register
+def d_dn_op(name):
+    def decode(op, r):
+        size = (op >> 6) & 3
+        if size == 3: raise BadOpcode
+        size = SIZES[size]
+        dn = 'd%d' % ((op >> 9) & 7)
+        if size == 'b' and (op >> 3) & 7 == 1: raise BadOpcode
+        if op & 0x100:
+            return '%s.%s %s,%s' % (name, size, dn, low_ea(r, op, size))
+        return '%s.%s %s,%s' % (name, size, low_ea(r, op, size), dn)
+    return decode
+
+
+# SUBA, CMPA, ADDA
+def d_an_op(name):
+    def decode(op, r):
+        size = 'l' if op & 0x100 else 'w'
+        return '%s.%s %s,%s' % (name, size, low_ea(r, op, size), AREGS[(op >> 9) & 7])
+    return decode
+
+
+# SUBX, ADDX, SBCD, ABCD (and CMPM, which only has the memory form)
+def d_extended(name, sized=True):
+    def decode(op, r):
+        size = (op >> 6) & 3
+        if sized and size == 3: raise BadOpcode
+        suffix = '.' + SIZES[size] if sized else ''
+        rx, ry = (op >> 9) & 7, op & 7
+        if name == 'cmpm': return 'cmpm%s (%s)+,(%s)+' % (suffix, AREGS[ry], AREGS[rx])
+        if op & 8: return '%s%s -(%s),-(%s)' % (name, suffix, AREGS[ry], AREGS[rx])
+        return '%s%s d%d,d%d' % (name, suffix, ry, rx)
+    return decode
+
+
+def d_muldiv(name):
+    return lambda op, r: '%s.w %s,d%d' % (name, low_ea(r, op), (op >> 9) & 7)
+
+
+def d_exg(op, r):
+    rx, ry = (op >> 9) & 7, op & 7
+    mode = (op >> 3) & 0x1f
+    if mode == 0x08: return 'exg d%d,d%d' % (rx, ry)
+    if mode == 0x09: return 'exg %s,%s' % (AREGS[rx], AREGS[ry])
+    return 'exg d%d,%s' % (rx, AREGS[ry])
+
+
+def d_aline(op, r):
+    return '_%04X' % op
+
+
+SHIFTS = ['as', 'ls', 'rox', 'ro']
+
+
+def d_shift_mem(op, r):
+    name = SHIFTS[(op >> 9) & 3] + ('l' if op & 0x100 else 'r')
+    return '%s.w %s' % (name, low_ea(r, op))
+
+
+def d_shift_reg(op, r):
+    size = (op >> 6) & 3
+    if size == 3: raise BadOpcode
+    name = SHIFTS[(op >> 3) & 3] + ('l' if op & 0x100 else 'r')
+    count = (op >> 9) & 7
+    count = 'd%d' % count if op & 0x20 else '#%d' % (count or 8)
+    return '%s.%s %s,d%d' % (name, SIZES[size], count, op & 7)
+
+
+# (bit pattern, allowed EA class of the low six bits or None, decoder), most specific first.
+# In the pattern, 0 and 1 must match and any other character is a field.
+PATTERNS = [
+    ('0000000000111100', None, d_to_ccr_sr('ori')),
+    ('0000000001111100', None, d_to_ccr_sr('ori')),
+    ('0000001000111100', None, d_to_ccr_sr('andi')),
+    ('0000001001111100', None, d_to_ccr_sr('andi')),
+    ('0000101000111100', None, d_to_ccr_sr('eori')),
+    ('0000101001111100', None, d_to_ccr_sr('eori')),
+    ('0000ddd1oo001aaa', None, d_movep),
+    ('0000ddd100eeeeee', EA_DATA, d_bitop_dynamic),
+    ('0000ddd1tteeeeee', EA_DALT, d_bitop_dynamic),
+    ('0000100000eeeeee', EA_DATA - {11}, d_bitop_static),
+    ('00001000tteeeeee', EA_DALT, d_bitop_static),
+    ('00000000sseeeeee', EA_DALT, d_immediate('ori')),
+    ('00000010sseeeeee', EA_DALT, d_immediate('andi')),
+    ('00000100sseeeeee', EA_DALT, d_immediate('subi')),
+    ('00000110sseeeeee', EA_DALT, d_immediate('addi')),
+    ('00001010sseeeeee', EA_DALT, d_immediate('eori')),
+    ('00001100sseeeeee', EA_DATA - {11}, d_immediate('cmpi')),
+
+    ('00ssaaa001eeeeee', EA_ALL, d_movea),
+    ('00ssdddmmmeeeeee', EA_ALL, d_move),
+
+    ('0100101011111100', None, d_fixed('illegal')),
+    ('0100111001110000', None, d_fixed('reset')),
+    ('0100111001110001', None, d_fixed('nop')),
+    ('0100111001110010', None, d_word_operand('stop #$%x')),
+    ('0100111001110011', None, d_fixed('rte')),
+    ('0100111001110100', None, lambda op, r: 'rtd #%s' % signedhex(r.sword())),
+    ('0100111001110101', None, d_fixed('rts')),
+    ('0100111001110110', None, d_fixed('trapv')),
+    ('0100111001110111', None, d_fixed('rtr')),
+    ('010011100111101d', None, d_movec),
+    ('010011100100vvvv', None, d_trap),
+    ('0100111001010rrr', None, d_link),
+    ('0100111001011rrr', None, d_reg('unlk %s', areg=True)),
+    ('010011100110drrr', None, d_usp),
+    ('0100100000001rrr', None, d_link_l),
+    ('0100100001000rrr', None, d_reg('swap %s')),
+    ('0100100010000rrr', None, d_reg('ext.w %s')),
+    ('0100100011000rrr', None, d_reg('ext.l %s')),
+    ('0100100111000rrr', None, d_reg('extb.l %s')),
+    ('0100000011eeeeee', EA_DALT, d_move_sr('from sr')),
+    ('0100010011eeeeee', EA_DATA, d_move_sr('to ccr')),
+    ('0100011011eeeeee', EA_DATA, d_move_sr('to sr')),
+    ('01000000sseeeeee', EA_DALT, d_unary('negx')),
+    ('01000010sseeeeee', EA_DALT, d_unary('clr')),
+    ('01000100sseeeeee', EA_DALT, d_unary('neg')),
+    ('01000110sseeeeee', EA_DALT, d_unary('not')),
+    ('0100100000eeeeee', EA_DALT, d_ea_only('nbcd', 'b')),
+    ('0100100001eeeeee', EA_CTRL, d_ea_only('pea', 'l')),
+    ('010010001seeeeee', EA_CALT | {4}, d_movem),
+    ('010011001seeeeee', EA_CTRL | {3}, d_movem),
+    ('0100101011eeeeee', EA_DALT, d_ea_only('tas', 'b')),
+    ('01001010sseeeeee', EA_ALL, d_tst),
+    ('0100111010eeeeee', EA_CTRL, d_ea_only('jsr', 'l')),
+    ('0100111011eeeeee', EA_CTRL, d_ea_only('jmp', 'l')),
+    ('0100aaa111eeeeee', EA_CTRL, d_lea),
+    ('0100ddd110eeeeee', EA_DATA, d_chk),
+
+    ('0101cccc11001rrr', None, d_dbcc),
+    ('0101cccc11eeeeee', EA_DALT, d_scc),
+    ('0101ddd0sseeeeee', EA_ALT, d_quick('addq')),
+    ('0101ddd1sseeeeee', EA_ALT, d_quick('subq')),
+
+    ('0110ccccdddddddd', None, d_branch),
+
+    ('0111ddd0dddddddd', None, d_moveq),
+
+    ('1000ddd011eeeeee', EA_DATA, d_muldiv('divu')),
+    ('1000ddd111eeeeee', EA_DATA, d_muldiv('divs')),
+    ('1000xxx10000myyy', None, d_extended('sbcd', sized=False)),
+    ('1000ddd0sseeeeee', EA_DATA, d_dn_op('or')),
+    ('1000ddd1sseeeeee', EA_MALT, d_dn_op('or')),
+
+    ('1001aaas11eeeeee', EA_ALL, d_an_op('suba')),
+    ('1001xxx1ss00myyy', None, d_extended('subx')),
+    ('1001ddd0sseeeeee', EA_ALL, d_dn_op('sub')),
+    ('1001ddd1sseeeeee', EA_MALT, d_dn_op('sub')),
+
+    ('1010tttttttttttt', None, d_aline),
+
+    ('1011aaas11eeeeee', EA_ALL, d_an_op('cmpa')),
+    ('1011xxx1ss001yyy', None, d_extended('cmpm')),
+    ('1011ddd1sseeeeee', EA_DALT, d_dn_op('eor')),
+    ('1011ddd0sseeeeee', EA_ALL, d_dn_op('cmp')),
+
+    ('1100ddd011eeeeee', EA_DATA, d_muldiv('mulu')),
+    ('1100ddd111eeeeee', EA_DATA, d_muldiv('muls')),
+    ('1100xxx10000myyy', None, d_extended('abcd', sized=False)),
+    ('1100xxx101000yyy', None, d_exg),
+    ('1100xxx101001yyy', None, d_exg),
+    ('1100xxx110001yyy', None, d_exg),
+    ('1100ddd0sseeeeee', EA_DATA, d_dn_op('and')),
+    ('1100ddd1sseeeeee', EA_MALT, d_dn_op('and')),
+
+    ('1101aaas11eeeeee', EA_ALL, d_an_op('adda')),
+    ('1101xxx1ss00myyy', None, d_extended('addx')),
+    ('1101ddd0sseeeeee', EA_ALL, d_dn_op('add')),
+    ('1101ddd1sseeeeee', EA_MALT, d_dn_op('add')),
+
+    ('11100ttd11eeeeee', EA_MALT, d_shift_mem),
+    ('1110cccdssittrrr', None, d_shift_reg),
+]
+
+
+_table = None # _table[opcode word] = decoder or None
+
+
+def _build():
+    global _table
+
+    compiled = []
+    for pattern, classes, decoder in PATTERNS:
+        mask = int(''.join('1' if c in '01' else '0' for c in pattern), 2)
+        match = int(''.join(c if c in '01' else '0' for c in pattern), 2)
+        compiled.append((mask, match, classes, decoder))
+
+    # Bucket the patterns by the top four bits of the opcode
+    lines = [[p for p in compiled if line & (p[0] >> 12) == p[1] >> 12] for line in range(16)]
+
+    table = [None] * 0x10000
+    for op in range(0x10000):
+        for mask, match, classes, decoder in lines[op >> 12]:
+            if op & mask == match:
+                if classes is not None and eanum((op >> 3) & 7, op & 7) not in classes: continue
+                table[op] = decoder
+                break
+
+    _table = table
+    return table
+
+
+# Decode one instruction at code[pc:], not reading past end.
+# Returns (length, text), or None if this is not a valid instruction.
+def decode(code, pc, end):
+    if pc + 2 > end: return None
+
+    op, = struct.unpack_from('>H', code, pc)
+    decoder = (_table or _build())[op]
+    if decoder is None: return None
+
+    r = Reader(code, pc, end)
+    try:
+        text = decoder(op, r)
+    except BadOpcode:
+        return None
+
+    return r.pos - pc, text
+
+
+# Yield (offset, length, text) for each instruction in code[start:end],
+# falling back to dc.w (and dc.b for an odd byte) where nothing decodes
+def disassemble(code, start, end):
+    pc = start
+    if pc & 1 and pc < end:
+        yield pc, 1, 'dc.b $%02x' % code[pc]
+        pc += 1
+
+    while pc < end:
+        if pc + 1 == end:
+            yield pc, 1, 'dc.b $%02x' % code[pc]
+            break
+
+        got = decode(code, pc, end)
+        if got is None:
+            yield pc, 2, 'dc.w $%04x' % struct.unpack_from('>H', code, pc)
+            pc += 2
+        else:
+            length, text = got
+            yield pc, length, text
+            pc += length
@@ -0,0 +1,96 @@
+# Structured output, for programs rather than people: the same facts as the listing,
+# without having to parse it back out with regexes.
+#
+# dump_ndjson() writes one JSON object per module per line (JSON Lines), as it goes.
+# dump_columns() writes one JSON object of flat tables, each a dict of equal-length column lists,
+# which loads straight into a dataframe or analytics store: modules, entries, patches,
+# coderefs, romrefs and oldrefs, joined on the module's jt.
+
+import json
+import sys
+
+import lpch
+
+
+# Coderef opcodes, as in the listing
+OPCODES = ['lea a0', 'lea a1', 'lea a2', 'lea a3', 'lea a4', 'lea a5', 'lea a6', 'lea sp',
+    'pea', 'jsr', 'jmp', 'opcode11', 'opcode12', 'opcode13', 'opcode14', 'dcImport']
+
+# The columns of the modules table (plus conds)
+MODULE_COLUMNS = ('jt', 'name', 'name_source', 'hash', 'resource', 'ofs', 'end')
+
+
+# One dict per module, in jump table order
+def records(ps):
+    for mjt, mod in sorted(ps.modtable.items()):
+        hashcrc = ps.namedb.get(mjt, [None, None, None])[2]
+
+        entries = []
+        patches = []
+        for i, ofs in enumerate([0] + mod.ents):
+            jt = mjt + i
+            if i: entries.append(dict(jt=jt, ofs=ofs, name=ps.getname(jt), name_source=ps.namesource(jt)))
+            for trap, condbits in ps.jtpatches.get(jt, ()):
+                patches.append(dict(jt=jt, trap=trap, conds=_conds(ps, condbits)))
+
+        yield dict(
+            jt=mjt,
+            name=ps.getname(mjt),
+            name_source=ps.namesource(mjt),
+            hash=None if hashcrc is None else '%08x' % hashcrc,
+            resource=mod.num,
+            conds=_conds(ps, mod.num),
+            ofs=mod.ofs,
+            end=mod.end,
+            entries=entries,
+            patches=patches,
+            coderefs=[dict(ofs=ofs, len=reflen, opcode=OPCODES[opcode], resident=resident,
+                    target_jt=targ_jt, target=ps.getname(targ_jt))
+                for ofs, reflen, opcode, resident, targ_jt in mod.coderefs],
+            romrefs=[dict(ofs=ofs, len=reflen, macro=macroname, bind_idx=bind_idx,
+                    addrs={rom: addr for rom, addr in zip(ps.condnames, romaddrs) if addr is not None},
+                    symbol=ps.romaddrsym(romaddrs, bind_idx) or None)
+                for ofs, reflen, macroname, romaddrs, bind_idx in mod.romrefs],
+            oldrefs=[dict(ofs=ofs, len=reflen, macro=macroname) for ofs, reflen, macroname in mod.oldrefs],
+        )
+
+
+def _conds(ps, bitfields):
+    return [ps.condnames[b] for b in lpch.bits(bitfields)]
+
+
+# JSON Lines: one module per line
+def dump_ndjson(ps, file=None):
+    write = (file or sys.stdout).write
+    for rec in records(ps):
+        write(json.dumps(rec, separators=(',', ':')))
+        write('\n')
+
+
+# Flat tables as {table: {column: [values]}}. Nested lists become rows of their own table,
+# keyed by module_jt, and ROM addresses become one column per ROM.
+def columns(ps):
+    tables = {}
+
+    def add(table, row):
+        cols = tables.setdefault(table, {})
+        for k, v in row.items():
+            cols.setdefault(k, []).append(v)
+
+    for rec in records(ps):
+        mjt = rec['jt']
+        add('modules', dict({k: rec[k] for k in MODULE_COLUMNS}, conds=','.join(rec['conds'])))
+        for e in rec['entries']: add('entries', dict(module_jt=mjt, **e))
+        for p in rec['patches']: add('patches', dict(module_jt=mjt, jt=p['jt'], trap=p['trap'], conds=','.join(p['conds'])))
+        for r in rec['coderefs']: add('coderefs', dict(module_jt=mjt, **r))
+        for r in rec['romrefs']:
+            row = dict(module_jt=mjt, **{k: v for k, v in r.items() if k != 'addrs'})
+            row.update(('addr_' + rom, r['addrs'].get(rom)) for rom in ps.condnames[:ps.nroms])
+            add('romrefs', row)
+        for r in rec['oldrefs']: add('oldrefs', dict(module_jt=mjt, **r))
+
+    return tables
+
+
+def dump_columns(ps, file=None):
+    json.dump(columns(ps), file or sys.stdout, separators=(',', ':'))
@@ -0,0 +1,168 @@
+# Link a parsed patch set for one machine, as the System does at boot: take the resources that
+# apply to its ROM, keep the modules that it would install (and whatever they refer to),
+# lay them out one after another and fill in their ROM addresses and references to each other.
+#
+# An export applies if its condition bits include the ROM and every other condition in them
+# holds. References between modules become PC-relative instructions (lea/pea/jsr/jmp d16(pc)),
+# resident or not, and dcImport becomes an absolute address. Where the target is out of reach
+# of 16 bits, the reference goes instead to a 'jmp target' stub placed right after its module,
+# as it would through the jump table. The "old routine" words (ACBDADFB) are left alone, for whoever installs
+# the patches to fill in, and listed in the map with the traps.
+
+import struct
+from collections import namedtuple
+
+from lpch import bits
+
+
+# Where each ROM starts, to turn the ROM offsets in rom_binds into addresses
+ROM_BASES = {
+    'Plus': 0x400000,
+    'SE': 0x400000,
+    'II': 0x40800000,
+    'Portable': 0x900000,
+    'IIci': 0x40800000,
+    'SuperMario': 0x40800000,
+}
+
+# The instruction word for each coderef opcode, before its 16-bit displacement.
+# None for dcImport, which is a 4-byte address, and for opcodes that the linker never emits.
+PCREL_OPCODES = [0x41fa | n << 9 for n in range(8)] + [0x487a, 0x4eba, 0x4efa, None, None, None, None, None]
+DCIMPORT = 15
+JMP_ABS_L = 0x4ef9
+
+
+# The linked image: its bytes, and
+#   symbols as [(address, name)], for every module and entry point,
+#   patches as [(address, trap, conds)], trap 0 for an InstallProc,
+#   oldrefs as [(address of the ACBDADFB word, macro, name of the module)]
+Image = namedtuple('Image', 'base data symbols patches oldrefs')
+
+
+# Does an export with these condition bits apply on this ROM with these other conditions?
+def applies(ps, condbits, rom, conds):
+    if not condbits & (1 << rom): return False
+    return all(ps.condnames[b] in conds for b in bits(condbits) if b >= ps.nroms)
+
+
+# The jump table indices of the modules that get installed, most of them because they export
+# something that applies, the rest because an installed module refers to them
+def select(ps, rom, conds):
+    available = {mjt: mod for mjt, mod in ps.modtable.items() if mod.num & (1 << rom)}
+    owner = {mjt + i: mjt for mjt, mod in available.items() for i in range(1 + len(mod.ents))}
+
+    todo = [owner[jt] for jt, exports in ps.jtpatches.items()
+        if jt in owner and any(applies(ps, condbits, rom, conds) for _, condbits in exports)]
+    selected = set()
+    while todo:
+        mjt = todo.pop()
+        if mjt in selected: continue
+        selected.add(mjt)
+        for _, _, _, _, targ_jt in available[mjt].coderefs:
+            if targ_jt not in owner:
+                raise ValueError('%s refers to %03X, which is not linked for %s' % (ps.getname(mjt), targ_jt, ps.condnames[rom]))
+            todo.append(owner[targ_jt])
+
+    return sorted(selected)
+
+
+def link(ps, romname, conds=(), base=0, rom_base=None):
+    if romname not in ps.condnames[:ps.nroms]: raise ValueError('%s is not a ROM of this patch set' % romname)
+    for cond in conds:
+        if cond not in ps.condnames[ps.nroms:]: raise ValueError('%s is not a condition of this patch set' % cond)
+    rom = ps.condnames.index(romname)
+    if rom_base is None: rom_base = ROM_BASES[romname]
+    conds = set(conds)
+
+    mjts = select(ps, rom, conds)
+
+    # Give stubs to the references that turn out to be out of reach, until none are
+    islands = {mjt: [] for mjt in mjts}
+    while 1:
+        data, starts, addrs, stubs = _layout(ps, mjts, base, islands)
+        far = []
+        for mjt in mjts:
+            for ofs, _, opcode, _, targ_jt in ps.modtable[mjt].coderefs:
+                target = stubs.get((mjt, targ_jt), addrs[targ_jt])
+                if opcode != DCIMPORT and not -0x8000 <= target - (base + starts[mjt] + ofs + 2) < 0x8000:
+                    if targ_jt in islands[mjt]:
+                        raise ValueError('%s+%x: %s is out of reach even of a stub' % (ps.getname(mjt), ofs, ps.getname(targ_jt)))
+                    far.append((mjt, targ_jt))
+        if not far: break
+        for mjt, targ_jt in far:
+            if targ_jt not in islands[mjt]: islands[mjt].append(targ_jt)
+
+    symbols = []
+    patches = []
+    oldrefs = []
+    for mjt in mjts:
+        mod = ps.modtable[mjt]
+        start = starts[mjt]
+
+        for i in range(1 + len(mod.ents)):
+            jt = mjt + i
+            symbols.append((addrs[jt], ps.getname(jt)))
+            for trap, condbits in ps.jtpatches.get(jt, ()):
+                if applies(ps, condbits, rom, conds):
+                    patches.append((addrs[jt], trap, ps.condstr(condbits)))
+
+        for ofs, _, opcode, _, targ_jt in mod.coderefs:
+            if opcode == DCIMPORT:
+                struct.pack_into('>L', data, start + ofs, addrs[targ_jt])
+                continue
+
+            if PCREL_OPCODES[opcode] is None:
+                raise ValueError('%s+%x: unknown coderef opcode %d' % (ps.getname(mjt), ofs, opcode))
+            disp = stubs.get((mjt, targ_jt), addrs[targ_jt]) - (base + start + ofs + 2)
+            struct.pack_into('>Hh', data, start + ofs, PCREL_OPCODES[opcode], disp)
+
+        for ofs, reflen, macroname, romaddrs, bind_idx in mod.romrefs:
+            if romaddrs[rom] is None:
+                raise ValueError('%s+%x: ROM address %d has no %s address' % (ps.getname(mjt), ofs, bind_idx, romname))
+            struct.pack_into('>L', data, start + ofs + reflen - 4, rom_base + romaddrs[rom])
+
+        for ofs, reflen, macroname in mod.oldrefs:
+            oldrefs.append((base + start + ofs + reflen - 4, macroname, ps.getname(mjt)))
+
+    return Image(base, bytes(data), symbols, patches, oldrefs)
+
+
+# Lay out the modules in jump table order, each followed by its stubs ('jmp target.l')
+# for the targets in islands[mjt]. Returns the bytes, starts[mjt] = offset of each module,
+# addrs[jt] = address of every module and entry point, and stubs[(mjt, targ_jt)] = address of a stub.
+def _layout(ps, mjts, base, islands):
+    data = bytearray()
+    starts = {}
+    addrs = {}
+    stub_ofs = {}
+    for mjt in mjts:
+        mod = ps.modtable[mjt]
+        starts[mjt] = len(data)
+        for i, ofs in enumerate([0] + mod.ents):
+            addrs[mjt + i] = base + len(data) + ofs
+        data += ps.resources[mod.num][mod.ofs:mod.end]
+        if len(data) % 2: data.append(0)
+
+        for targ_jt in islands[mjt]:
+            stub_ofs[(mjt, targ_jt)] = len(data)
+            data += bytes(6)
+
+    stubs = {}
+    for (mjt, targ_jt), ofs in stub_ofs.items():
+        struct.pack_into('>HL', data, ofs, JMP_ABS_L, addrs[targ_jt])
+        stubs[(mjt, targ_jt)] = base + ofs
+    return data, starts, addrs, stubs
+
+
+# The symbol map, one line per module, entry point, export and old routine word, by address
+def map_lines(image):
+    lines = [(addr, 0, '%08X   %s' % (addr, name)) for addr, name in image.symbols]
+    for addr, trap, conds in image.patches:
+        text = 'PatchProc $%X,%s' % (trap, conds) if trap else 'InstallProc %s' % conds
+        lines.append((addr, 1, '%08X   # %s' % (addr, text)))
+    for addr, macroname, name in image.oldrefs:
+        lines.append((addr, 2, '%08X   %s in %s' % (addr, macroname, name)))
+
+    yield '# %d bytes at %08X' % (len(image.data), image.base)
+    for _, _, line in sorted(lines):
+        yield line
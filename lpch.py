@@ -0,0 +1,767 @@
+# Parse 'lpch' resources (or a 'gpch' wrapping several of them) into a PatchSet.
+# This is the library behind patch_rip.py, so that many System files can be
+# parsed in one process without paying for startup each time.
+
+import binascii
+import bisect
+import re
+import struct
+import sys
+from collections import defaultdict, namedtuple
+from os import path
+
+import dis68k
+import romlocs
+import rsrcfork
+from stats import NO_STATS
+
+
+# Regex used to find the output of macros
+# ACBDADFB should only ever be produced by these macros
+OLD_ROUTINE_RE = rb'''
+    (?P<peaOld>             \x2f\x3c \xac\xbd\xad\xfb) |
+    (?P<jsrOld>             \x4e\xb9 \xac\xbd\xad\xfb) |
+    (?P<bccOld>    \x65\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<bcsOld>    \x64\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<beqOld>    \x66\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<bgeOld>    \x6d\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<bgtOld>    \x6f\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<bhiOld>    \x63\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<bleOld>    \x6e\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<blsOld>    \x62\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<bltOld>    \x6c\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<bmiOld>    \x6a\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<bneOld>    \x67\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<bplOld>    \x6b\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<bvcOld>    \x69\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<bvsOld>    \x68\x06 \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<jmpOld>             \x4e\xf9 \xac\xbd\xad\xfb) |
+    (?P<leaOld_a0>          \x20\x7c \xac\xbd\xad\xfb) |
+    (?P<leaOld_a1>          \x22\x7c \xac\xbd\xad\xfb) |
+    (?P<leaOld_a2>          \x24\x7c \xac\xbd\xad\xfb) |
+    (?P<leaOld_a3>          \x26\x7c \xac\xbd\xad\xfb) |
+    (?P<leaOld_a4>          \x28\x7c \xac\xbd\xad\xfb) |
+    (?P<leaOld_a5>          \x2a\x7c \xac\xbd\xad\xfb) |
+    (?P<leaOld_a6>          \x2c\x7c \xac\xbd\xad\xfb) |
+    (?P<leaOld_sp>          \x2e\x7c \xac\xbd\xad\xfb) |
+    (?P<dcOld>                       \xac\xbd\xad\xfb)
+'''
+
+# The same macros relocated to hardcoded ROM locations, as {bytes before the address: name}.
+# The linker tells us where each address goes, so we can decode backwards from there.
+ROM_MACROS = {}
+for _name, _pattern in re.findall(rb'\(\?P<(\w+)>([^)]*)\)', OLD_ROUTINE_RE):
+    _prefix = bytes.fromhex(_pattern.replace(b'\\x', b'').replace(b' ', b'').decode('ascii'))[:-4]
+    ROM_MACROS[_prefix] = _name.decode('ascii').replace('Old', 'ROM').replace('_', ' ')
+
+
+# The ROMs that a patch set can target, least significant bit first,
+# followed by the other conditions that an export can depend on
+ROMNAMES = ['Plus', 'SE', 'II', 'Portable', 'IIci', 'SuperMario']
+CONDNAMES = [
+    'noPatchProtector',
+    'notVM',
+    'notAUX',
+    'hasHMMU',
+    'hasPMMU',
+    'hasMemoryDispatch',
+    'has800KDriver',
+    'hasFDHDDriver',
+    'hasIWM',
+    'hasEricksonOverpatchMistake',
+    'hasEricksonSoundMgr',
+    'notEricksonSoundMgr',
+    'using24BitHeaps',
+    'using32BitHeaps',
+    'notTERROR',
+    'hasTERROR',
+    'hasC96',
+    'hasPwrMgr',
+]
+
+
+# Ways to name a module, best first
+NAME_SOURCES = ('linker', 'macsbug', 'hash')
+
+
+# One code module, with offsets relative to its resource (refs relative to the module)
+Module = namedtuple('Module', 'num ofs end ents coderefs romrefs oldrefs')
+
+# One 'gpch' of a System file: its resource ID, its {resource number: 'lpch' data}, the machines
+# listed in the 'gtbl' of the same ID, and whether the 'gusd' lists it (see system_groups)
+Group = namedtuple('Group', 'id resources machines used')
+
+
+# List of bit-shift values, least significant first
+def bits(n):
+    retval = []
+    shift = 0
+    while n:
+        if n & 1: retval.append(shift)
+        n >>= 1
+        shift += 1
+    return retval
+
+
+# The MacsBug symbol format as described in DisAsmLookup
+def macsbugsym(proc):
+    for i in range(0, len(proc), 2):
+        try:
+            if proc[i:i+2] in (b'\x4e\x75', b'\x4e\xd0'): # rts / jmp (a0)
+                i += 2
+            elif proc[i:i+2] == b'\x4e\x74': # rtd #$....
+                i += 4
+            else:
+                continue
+
+            if proc[i] == 0x80:
+                namestart = i+2
+                namestop = i+2 + proc[i+1]
+            elif 0x81 <= proc[i] <= 0x9f:
+                namestart = i+1
+                namestop = i+1 + (proc[i]&0x7f)
+            else:
+                continue
+
+            if len(proc) < namestop: continue
+            sym = proc[namestart:namestop]
+            if not re.match(rb'^[A-Za-z0-9 %_]+$', sym): continue
+
+            return bytes(sym).decode('ascii')
+
+            # Don't bother: the symbol is followed by a word containing the number of bytes of constants
+
+        except IndexError:
+            continue
+
+
+# A corruption of "A Proposal for Proquints"
+# https://arxiv.org/html/0901.4016
+# Arbitrary names for code modules that should be reasonably stable across rebuilds
+def prosept(x):
+    quint = list('???????')
+    for i in range(len(quint)):
+        if i & 1:
+            quint[i] = 'aiou'[x & 0x3]
+            x >>= 2
+        else:
+            quint[i] = 'bdfghjklmnprstvz'[x & 0xf]
+            x >>= 4
+    return ''.join(reversed(quint))
+
+
+# Everything learned from one group of 'lpch' resources
+class PatchSet:
+    def __init__(self, resources, stats=None):
+        # Sort the resources from most inclusive to least inclusive,
+        # because interpretation of later resources depends on metadata from earlier ones
+        self.resources = dict(sorted(resources.items(), key=lambda kv:(-len(bits(kv[0])), kv[0]))) # resources[num] = bytes of that 'lpch'
+        self.nroms = len(bits(max(resources)))
+        self.condnames = ROMNAMES[:self.nroms] + CONDNAMES
+        self.modtable = {} # modtable[jt] = Module
+        self.rom_binds = {} # rom_binds[idx] = [plus_addr, se_addr, ...]
+        self.jtpatches = defaultdict(list) # jtpatches[jt] = [(trap, condbits), ...]
+        self.namedb = {} # namedb[jt] = [linker, macsbug, hash]
+        self.pq_cache = {} # proquint -> better name, from an earlier run (anything with a get method)
+        self.rom_names = None # rom_names[idx] = name of rom_binds[idx], from LinkedPatches.lib (see romlib.attach)
+        self.rom_names_checked = False # whether rom_names fit ROMLOCS well enough to be believed
+        self.stats = stats or NO_STATS # time spent in each stage (see stats.py)
+
+    # The resolved name of every jump table entry is worked out once, on demand,
+    # and worked out again only if the names it depends on change
+    @property
+    def pq_cache(self):
+        return self._pq_cache
+
+    @pq_cache.setter
+    def pq_cache(self, pq_cache):
+        self._pq_cache = pq_cache
+        self._names = None
+
+    # Maintain a database of the best-possible name for each module
+    def setname(self, jt, name, kind):
+        if not name: return
+        kind = NAME_SOURCES.index(kind)
+        self.namedb.setdefault(jt, [None,None,None])[kind] = name
+        self._names = None
+
+    def getname(self, jt):
+        if self._names is None:
+            with self.stats.stage('naming'):
+                self._resolve_names()
+
+        if jt < len(self._names): return self._names[jt]
+
+        # Beyond the last named entry
+        if self._lastname is None: return '_%03X' % jt # last resort
+        name, i = self._lastname
+        return name + '_%d' % (jt-i+1)
+
+    # Every entry is named after the nearest named entry at or before it
+    def _resolve_names(self):
+        names = []
+        lastname = None
+        lookups = hits = 0
+        for jt in range(max(self.namedb, default=-1) + 1):
+            for kind, name in zip(NAME_SOURCES, self.namedb.get(jt, ())):
+                if name is not None:
+                    if kind == 'hash':
+                        pq = prosept(name)
+                        name = self.pq_cache.get(pq)
+                        lookups += 1
+                        if name is None:
+                            name = pq
+                        else:
+                            hits += 1
+
+                    lastname = (name, jt)
+                    break
+
+            if lastname is None:
+                names.append('_%03X' % jt) # last resort
+            elif lastname[1] == jt:
+                names.append(lastname[0])
+            else:
+                names.append(lastname[0] + '_%d' % (jt-lastname[1]+1))
+
+        self._names = names
+        self._lastname = lastname
+        if self.pq_cache: # a real cache (-c), not the empty default, which has no hit rate
+            self.stats.count('name cache lookups', lookups)
+            self.stats.count('name cache hits', hits)
+
+    # Where the name of an entry came from: one of NAME_SOURCES, 'cache' for a hash that the
+    # module name cache knows better, or None if it is named after an earlier entry
+    def namesource(self, jt):
+        for kind, name in zip(NAME_SOURCES, self.namedb.get(jt, ())):
+            if name is not None:
+                if kind == 'hash' and self.pq_cache.get(prosept(name)) is not None:
+                    return 'cache'
+                return kind
+        return None
+
+    # Names worth remembering in the module name cache: proquint -> linker's name
+    def learned_names(self):
+        learned = {}
+        for realname, _, fakename in self.namedb.values():
+            if realname and fakename is not None:
+                learned[prosept(fakename)] = realname
+        return learned
+
+    # Where the code starts in resource num, after its header
+    def codeofs(self, num):
+        ofs = 0
+        if len(bits(num)) == 1:
+            ofs += 2 # skip "number of 'lpch' resources for this ROM"
+        elif num == max(self.resources):
+            ofs += 2 # skip "number of entries in the bound ROM address table"
+            ofs += 2 # skip "number of entries in the jump table"
+        return ofs + 4 # skip the code length
+
+    # Something like '(Plus,SE,II,IIci,notAUX)'
+    def condstr(self, bitfields):
+        return '(' + ','.join(self.condnames[b] for b in bits(bitfields)) + ')'
+
+    # Something like '((Portable,$5ec8),(IIci,$ae96))'
+    def romaddrspec(self, offset_list):
+        concrete = []
+        for romname, romaddr in zip(self.condnames, offset_list):
+            if romaddr is not None:
+                concrete.append('(%s,$%x)' % (romname, romaddr))
+        return '(' + ','.join(concrete) + ')'
+
+    # Take the same data as above, and get 'AfterFreezeTimeInRmvTime'
+    # (from ROMLOCS, or failing that the name from LinkedPatches.lib if we know the bind index).
+    # A library name gets a '?' unless the library names as a whole agreed with ROMLOCS.
+    def romaddrsym(self, offset_list, bind_idx=None):
+        abstract = set()
+        for romname, romaddr in zip(self.condnames, offset_list):
+            if romaddr is not None:
+                found = romlocs.lookup(romname, romaddr)
+                if found:
+                    abstract.add(found)
+
+        if not abstract and self.rom_names and bind_idx is not None and bind_idx < len(self.rom_names):
+            name = self.rom_names[bind_idx]
+            return name if self.rom_names_checked else name + '?'
+
+        return '/'.join(sorted(abstract))
+
+
+# Read files as named on a command line: a whole System file (see rsrcfork.py),
+# several 'lpch' resources (file names ending in the resource number, as rfx expands
+# System//lpch/) or a single 'gpch' wrapper.
+# Returns a dict of {resource number: 'lpch' data}.
+def load_files(paths, gpch=None):
+    files = {path.basename(fn): rsrcfork.map_file(fn) for fn in paths}
+    if len(files) > 1: # multiple lpch resources
+        return {int(re.search(r'\d+$', fn).group(0)): fbin for fn, fbin in files.items()}
+
+    fn, fbin = next(iter(files.items()))
+    system = rsrcfork.read_resources(paths[0], fbin)
+    if system is not None: # whole System file
+        return system_lpches(system, gpch)
+    else: # single gpch wrapper
+        if fbin[:2] != b'\x00\x01': raise ValueError('%r not a valid gpch' % fn)
+        return split_gpch(fbin)
+
+
+# Pick the 'lpch' resources out of a System file's resources:
+# all the 'lpch' resources, or the contents of one 'gpch'
+def system_lpches(system, gpch=None):
+    lpches = {rid: data for (rtype, rid), data in system.items() if rtype == b'lpch'}
+    gpches = {rid: data for (rtype, rid), data in system.items() if rtype == b'gpch'}
+
+    if gpch is not None:
+        if gpch not in gpches: raise ValueError('no gpch %d' % gpch)
+        return split_gpch(gpches[gpch])
+    elif lpches:
+        return lpches
+    elif len(gpches) == 1:
+        return split_gpch(next(iter(gpches.values())))
+    elif gpches:
+        raise ValueError('choose a gpch: %s' % ', '.join(str(rid) for rid in sorted(gpches)))
+    else:
+        raise ValueError('no lpch or gpch resources')
+
+
+# Every 'gpch' of a System file, as a list of Groups in ID order.
+# The layout of 'gtbl' and 'gusd' is not documented. Both are read as a count word followed by
+# that many words: 'gtbl' N as the machines (Gestalt 'mach' values) that load 'gpch' N, and
+# 'gusd' as the IDs of the groups in use. machines is None where there is no 'gtbl' or it does
+# not read that way, and used is None where the same goes for the 'gusd'.
+def system_groups(system):
+    gpches = {rid: data for (rtype, rid), data in system.items() if rtype == b'gpch'}
+    if not gpches: raise ValueError('no gpch resources')
+
+    gusd = [data for (rtype, rid), data in sorted(system.items()) if rtype == b'gusd']
+    used = _counted_words(gusd[0]) if gusd else None
+
+    groups = []
+    for rid, data in sorted(gpches.items()):
+        gtbl = system.get((b'gtbl', rid))
+        machines = _counted_words(gtbl) if gtbl is not None else None
+        groups.append(Group(rid, split_gpch(data), machines, None if used is None else rid in used))
+    return groups
+
+
+# A count word followed by that many words, or None if the data is not that shape
+def _counted_words(data):
+    if len(data) < 2: return None
+    n, = struct.unpack_from('>H', data)
+    if len(data) != 2 + 2*n: return None
+    return list(struct.unpack_from('>%dH' % n, data, 2))
+
+
+# The groups of a System file named on a command line (see system_groups)
+def load_groups(path):
+    system = rsrcfork.read_resources(path)
+    if system is None: raise ValueError('%r is not a System file' % path)
+    return system_groups(system)
+
+
+# Name modules from the linker's listing (LinkedPatch -l): lines of "jt name", jt in hex
+def read_linker_names(ps, names_path):
+    with open(names_path) as f:
+        for l in f:
+            try:
+                jt, name = l.split()
+                ps.setname(int(jt, 16), name, 'linker')
+            except ValueError:
+                pass
+
+
+def parse_files(paths, gpch=None):
+    return parse_lpch_set(load_files(paths, gpch))
+
+
+# Split a 'gpch' wrapper into a dict of {resource number: 'lpch' data}
+def split_gpch(fbin):
+    if fbin[:2] != b'\x00\x01': raise ValueError('not a valid gpch')
+
+    resources = {}
+    ofs = 18
+    for i in range(struct.unpack_from('>H', fbin, 16)[0]):
+        num, size = struct.unpack_from('>hL', fbin, ofs)
+        resources[num] = fbin[ofs+6:ofs+6+size]
+        ofs += 6 + size
+
+    return resources
+
+
+def parse_gpch(fbin):
+    return parse_lpch_set(split_gpch(fbin))
+
+
+# Parse a dict of {resource number: 'lpch' data} into a PatchSet
+def parse_lpch_set(resources, stats=None):
+    ps = PatchSet(resources, stats)
+    for num, data in ps.resources.items():
+        _parse_lpch(ps, num, data)
+        ps.stats.count('bytes', len(data))
+
+    # Counted once per set, not per module, so as to cost nothing while parsing
+    ps.stats.count('modules', len(ps.modtable))
+    for mod in ps.modtable.values():
+        ps.stats.count('entries', len(mod.ents))
+        ps.stats.count('coderefs', len(mod.coderefs))
+        ps.stats.count('romrefs', len(mod.romrefs))
+        ps.stats.count('oldrefs', len(mod.oldrefs))
+    return ps
+
+
+# First pass over one resource. Populate modtable.
+# Done as one pass over the resource for each kind of work, each timed as a stage, so that the
+# stats show where parsing time goes without paying for a stage per module.
+def _parse_lpch(ps, num, data):
+    rom_binds = ps.rom_binds # written and read by this loop
+
+    codeofs = ps.codeofs(num)
+    codelen, = struct.unpack_from('>L', data, codeofs-4)
+    ofs = codeofs + codelen
+
+    with ps.stats.stage('rom fixups'):
+        # Unpack this resource's contribution to the table of ROM addresses
+        bind_idx, = struct.unpack_from('>H', data, ofs); ofs += 2
+        if bind_idx != 0xffff:
+            while 1:
+                for rom in reversed(bits(num)):
+                    addr = struct.unpack_from('>L', data, ofs-1)[0] & 0xffffff; ofs += 3
+                    rom_binds.setdefault(bind_idx, [None]*ps.nroms)[rom] = addr & 0x7fffff
+
+                bind_idx += 1
+
+                if addr & 0x800000: break
+
+        # Unpack the multiple linked lists of locations where a ROM address must be inserted
+        rom_fixups = [] # list of (offset_in_resource, bind_idx, rom_binds entry)
+        while 1:
+            head = struct.unpack_from('>L', data, ofs-1)[0] & 0xffffff; ofs += 3
+            if head == 0: break
+
+            tail = head
+            while 1:
+                link, bind_idx = struct.unpack_from('>HH', data, codeofs + tail)
+                rom_fixups.append((codeofs + tail, bind_idx, rom_binds[bind_idx]))
+
+                if link == 0: break
+                tail += 4 + 2*link
+
+        # Sorted, so that each module can find its own fixups by bisection
+        rom_fixups.sort(key=lambda fixup: fixup[0])
+        fixup_offsets = [fixup[0] for fixup in rom_fixups]
+
+    with ps.stats.stage('module map'):
+        # Unpack: modules; their JT index; their ref list head; their entry points and entry points' JT indices
+        mm_offsets = [codeofs];
+        mm_jts = defaultdict(lambda:0); mm_refheads = defaultdict(lambda:None); mm_ents = defaultdict(list)
+        mofs = codeofs
+        while 1:
+            opcode = data[ofs]; ofs += 1
+            midx = len(mm_offsets) - 1
+
+            if opcode <= 251 or opcode == 255: # distance opcode
+                if opcode == 255:
+                    distance, = struct.unpack_from('>H', data, offset=ofs); ofs += 2
+                else:
+                    distance = 2*opcode
+
+                mofs += distance
+
+                if data[ofs] == 253: # this is a ref list header
+                    ofs += 1
+                    mm_refheads[midx] = mofs
+                elif data[ofs] == 254: # this is an entry, not a fresh module
+                    ofs += 1
+                    mm_ents[midx].append(mofs)
+                else:
+                    mm_jts[midx+1] = mm_jts[midx] + 1 + len(mm_ents[midx])
+                    mm_offsets.append(mofs)
+
+            elif opcode == 252: # skip entries in the jump table
+                opcode2 = data[ofs]; ofs += 1
+                if opcode2 == 0: break
+
+                if 1 <= opcode2 <= 254: # number of jump table entries to skip
+                    skip = opcode2
+                elif opcode2 == 255: # word follows with number of jump table entries to skip
+                    skip, = struct.unpack_from('>H', data, offset=ofs); ofs += 2
+
+                mm_jts[midx] += skip
+
+            else:
+                raise ValueError
+
+        # so far, mm_offsets is all boundaries, including before first and after last mod
+        mm_ends = mm_offsets[1:]
+        mm_offsets = mm_offsets[:-1]
+
+        # Unpack the table of "exports"
+        if num == max(ps.resources):
+            jtpatches = ps.jtpatches # each value is tuple of (trap, condbits)
+
+            jt = 0
+            done = False
+            while not done:
+                cbytes = (len(ps.condnames) + 7) // 8 # bytes needed for enough bits
+                condbits = int.from_bytes(data[ofs:ofs+cbytes], byteorder='big'); ofs += cbytes
+
+                while 1:
+                    delta = data[ofs]; ofs += 1
+
+                    if delta == 254:
+                        break # break out of inner loop, get new condition set
+                    elif delta == 255:
+                        delta, = struct.unpack_from('>H', data, ofs); ofs += 2
+                        if delta == 0:
+                            done = True # break out of outer loop
+                            break
+
+                    jt += delta
+                    trap, = struct.unpack_from('>H', data, ofs); ofs += 2
+                    jtpatches[jt].append((trap, condbits))
+
+        # Each module in this resource, with its references to other code modules via the jump table
+        mods = [] # list of (Module, mjt, mdata, patches), the refs filled in by the passes below
+        for i, mofs in enumerate(mm_offsets):
+            mend = mm_ends[i]
+
+            # Adjust all these to be relative to the module start (which itself is relative to the file)
+            mjt = mm_jts[i]
+            mrefhead = mm_refheads[i]; mrefhead = mrefhead-mofs if mrefhead is not None else None
+            ments = [x-mofs for x in mm_ents[i]]
+
+            # A view of the module, not a copy. The "fixed-up" words that get different contents
+            # for the hash are kept aside as {offset: 4 bytes}, and stitched in by _patched_crc.
+            mdata = data[mofs:mend]
+            patches = {}
+
+            tcoderefs = []
+            if mrefhead is not None:
+                while 1:
+                    packed, = struct.unpack_from('>L', mdata, mrefhead)
+                    patches[mrefhead] = b'\xff\xff\xf0\x00' # all but targ_jt are useful for the hash
+
+                    resident = bool(packed & 0x80000000)
+                    link = ((packed >> 16) & 0x7fff) * 2
+                    opcode = (packed >> 12) & 0xf
+                    targ_jt = packed & 0xfff
+
+                    tcoderefs.append((mrefhead, 4, opcode, resident, targ_jt))
+
+                    if link == 0: break
+                    mrefhead += link
+
+            mods.append((Module(num, mofs, mend, ments, tcoderefs, [], []), mjt, mdata, patches))
+
+    # References to well-known fixed ROM locations
+    with ps.stats.stage('rom fixups'):
+        for mod, mjt, mdata, patches in mods:
+            lo = bisect.bisect_left(fixup_offsets, mod.ofs)
+            hi = bisect.bisect_left(fixup_offsets, mod.end, lo)
+            for fofs, bind_idx, romaddrs in rom_fixups[lo:hi]:
+                matchstart, macroname = _rommacro(mdata, patches, fofs-mod.ofs)
+                matchend = fofs-mod.ofs + 4
+                mod.romrefs.append((matchstart, matchend-matchstart, macroname, romaddrs, bind_idx))
+
+                # Hash the target name and stuff it where the address would go, for the ultimate hash below
+                # (not the LinkedPatches.lib name, so that hashes do not depend on having the library)
+                targ = ps.romaddrsym(romaddrs) or ps.romaddrspec(romaddrs)
+                patches[matchend-4] = struct.pack('>L', binascii.crc32(targ.encode('ascii')))
+
+    # References from patch modules to "the old version", represented as ACBDADFB
+    # (but not in the words that were fixed up above)
+    with ps.stats.stage('old refs'):
+        for mod, mjt, mdata, patches in mods:
+            for match in re.finditer(OLD_ROUTINE_RE, mdata, flags=re.VERBOSE):
+                matchstart, matchend = match.start(), match.end()
+                if any(pofs in patches for pofs in range(matchstart-3, matchend)): continue
+                macroname, text = next(i for i in match.groupdict().items() if i[1] or 'dc' in i[0])
+                macroname = macroname.replace('_', ' ')
+
+                mod.oldrefs.append((matchstart, matchend-matchstart, macroname))
+
+    # Provide a name if possible
+    with ps.stats.stage('hashing'):
+        for mod, mjt, mdata, patches in mods:
+            ps.setname(mjt, _patched_crc(mdata, patches), 'hash')
+            ps.setname(mjt, macsbugsym(mdata), 'macsbug')
+
+            ps.modtable[mjt] = mod
+
+
+# Which macro put a ROM address at this offset? The longest match wins, as dcROM matches anything.
+def _rommacro(mdata, patches, addrofs):
+    for n in (4, 2):
+        if addrofs >= n:
+            macroname = ROM_MACROS.get(_patched(mdata, patches, addrofs-n, addrofs))
+            if macroname: return addrofs-n, macroname
+
+    return addrofs, 'dcROM'
+
+
+# Bytes start:end of the module as they read with the 4-byte patches in place
+def _patched(mdata, patches, start, end):
+    window = bytearray(mdata[start:end])
+    for pofs in range(start-3, end):
+        if pofs in patches:
+            for i in range(max(pofs, start), min(pofs+4, end)):
+                window[i-start] = patches[pofs][i-pofs]
+    return bytes(window)
+
+
+# CRC-32 of the module with the 4-byte patches in place, without copying it
+def _patched_crc(mdata, patches):
+    crc = 0
+    pos = 0
+    for pofs, value in sorted(patches.items()):
+        crc = binascii.crc32(mdata[pos:pofs], crc)
+        crc = binascii.crc32(value, crc)
+        pos = pofs + 4
+    return binascii.crc32(mdata[pos:], crc)
+
+
+# Second pass. Read modtable and yield a listing one line at a time.
+def listing(ps, disasm=False):
+    for mjt, mod in sorted(ps.modtable.items()):
+        raw = ps.resources[mod.num][mod.ofs:mod.end]
+
+        yield '# ' + ps.condstr(mod.num)
+
+        # Runs of unannotated bytes are broken into lines of this many bytes,
+        # or disassembled whole
+        linebytes = 16
+        maxrun = len(raw) if disasm else linebytes
+        flush = _disasmlines if disasm else _hexlines
+        run_ofs = run_len = 0
+        for line_ofs, line_len, line in _module_lines(ps, mjt, mod, len(raw)):
+            if line is None and run_len and run_len < maxrun:
+                run_len += line_len
+                continue
+
+            if run_len:
+                yield from flush(raw, run_ofs, run_len, linebytes)
+                run_len = 0
+
+            if line is None:
+                run_ofs, run_len = line_ofs, line_len
+            elif line_len > 0:
+                yield '   *' + line
+            else:
+                yield line
+
+        if run_len:
+            yield from flush(raw, run_ofs, run_len, linebytes)
+
+        yield ''
+
+
+# Print the listing to a file (default stdout)
+def dump(ps, file=None, disasm=False):
+    write = (file or sys.stdout).write
+    for line in listing(ps, disasm):
+        write(line)
+        write('\n')
+
+
+# Printable bytes as themselves, the rest as '.'
+_ASCII_COLUMN = bytes(c if 33 <= c < 127 else ord('.') for c in range(256))
+
+
+# Something like '4e75 0000 ', with a space after each byte at an odd offset
+def _hexbytes(raw, line_ofs, line_len):
+    if not line_len: return ''
+    head = ''
+    if line_ofs % 2: # finish the word begun on the line before
+        head = '%02x ' % raw[line_ofs]
+        line_ofs += 1; line_len -= 1
+        if not line_len: return head
+    return head + raw[line_ofs:line_ofs+line_len].hex(' ', -2) + (' ' if line_len % 2 == 0 else '')
+
+
+# Something like '    4e75 0000  Nu..'
+def _hexlines(raw, line_ofs, line_len, linebytes):
+    line = _hexbytes(raw, line_ofs, line_len)
+
+    line = line.ljust(linebytes*5//2 + 2)
+    line += bytes(raw[line_ofs:line_ofs+line_len]).translate(_ASCII_COLUMN).decode('ascii').ljust(linebytes)
+
+    yield '    ' + line
+
+
+# Something like '    4eb9 0000 1234      jsr $1234'
+def _disasmlines(raw, run_ofs, run_len, linebytes):
+    for line_ofs, line_len, text in dis68k.disassemble(raw, run_ofs, run_ofs+run_len):
+        yield '    ' + _hexbytes(raw, line_ofs, line_len).ljust(27) + text
+
+
+# Yield (offset, length, text) for each label, annotated reference and byte of the module.
+# Text is None for a plain byte, and length is zero for a label.
+def _module_lines(ps, mjt, mod, modlen):
+    ents = [0] + mod.ents # the module start needs a try
+
+    # So we can pop from the end of these lists in O(1) time
+    ents = ents[::-1]
+    coderefs = mod.coderefs[::-1]
+    romrefs = mod.romrefs[::-1]
+    oldrefs = mod.oldrefs[::-1]
+
+    ofs = 0
+    while ofs <= modlen:
+        line_ofs = ofs
+
+        # Determine what kind of code goes at this line
+        nextline = None
+        if coderefs and coderefs[-1][0] == ofs:
+            _, reflen, opcode, resident, targ_jt = coderefs.pop()
+            opcode = (
+                'lea%s %s,a0', 'lea%s %s,a1', 'lea%s %s,a2', 'lea%s %s,a3',
+                'lea%s %s,a4', 'lea%s %s,a5', 'lea%s %s,a6', 'lea%s %s,sp',
+                'pea%s %s',    'jsr%s %s',    'jmp%s %s',    None,
+                'opcode12?',   'opcode13?',   'opcode14?',   'dcImport%s %s')[opcode]
+            opcode = opcode % ('Resident' * resident, ps.getname(targ_jt))
+            nextline = (ofs, reflen, opcode)
+            ofs += reflen
+
+        elif romrefs and romrefs[-1][0] == ofs:
+            _, reflen, macroname, romaddrs, bind_idx = romrefs.pop()
+            macroname = macroname.replace('ROM', 'ROM ' + ps.romaddrspec(romaddrs) + ',').rstrip(',')
+            if ps.rom_names:
+                macroname += ' ; ' + (ps.romaddrsym(romaddrs, bind_idx) or '?')
+            nextline = (ofs, reflen, macroname)
+            ofs += reflen
+
+        elif oldrefs and oldrefs[-1][0] == ofs:
+            _, reflen, oldref = oldrefs.pop()
+            nextline = (ofs, reflen, oldref)
+            ofs += reflen
+
+        elif ofs < modlen:
+            nextline = (ofs, 1, None)
+            ofs += 1
+
+        else:
+            ofs += 1
+
+        # Now create labels that should precede the actual line of code
+        for label_ofs in range(line_ofs, ofs):
+            if ents and ents[-1] == label_ofs:
+                ents.pop()
+
+                for trap, condbits in ps.jtpatches.get(mjt, ()):
+                    if trap:
+                        yield (None, 0, '# PatchProc $%X,%s' % (trap, ps.condstr(condbits)))
+                    else:
+                        yield (None, 0, '# InstallProc %s' % (ps.condstr(condbits)))
+
+                label = ps.getname(mjt)
+                if label_ofs > line_ofs:
+                    label += ' equ *+%d' % (label_ofs-line_ofs)
+                else:
+                    label += ':'
+                yield (None, 0, label)
+
+                mjt += 1 # advance to the next jump table entry
+
+        # Now issue the line of code
+        if nextline: yield nextline
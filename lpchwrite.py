@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+
+# The inverse of the first pass in lpch.py: write 'lpch' resources (and 'gpch' wrappers)
+# from a description of their modules, ROM addresses and exports.
+#
+# A description can come from describe(ps), to re-encode a real patch set, or from synth(),
+# which makes up patch sets of any size for benchmarks and fuzzing. roundtrip() checks that
+# parsing the encoding gives back the description.
+
+import argparse
+import os
+import random
+import struct
+from collections import namedtuple
+from os import path
+
+import lpch
+from lpch import bits
+
+
+# A whole patch set. rom_binds and jtpatches are as in PatchSet.
+PatchSpec = namedtuple('PatchSpec', 'nroms modules rom_binds jtpatches')
+
+# One code module: its resource, jump table index, bytes and entry points (offsets in the module),
+# coderefs as (offset, opcode, resident, targ_jt) and romrefs as (offset of the address, bind_idx).
+# The bytes at each ref are overwritten by the encoder.
+ModuleSpec = namedtuple('ModuleSpec', 'num jt code ents coderefs romrefs')
+
+
+# The order that PatchSet puts resources in
+def _resource_order(num):
+    return (-len(bits(num)), num)
+
+
+# {resource number: 'lpch' data}
+def encode_set(spec):
+    maxnum = (1 << spec.nroms) - 1
+
+    # Each resource gets the bind entries for exactly its ROMs, in one run
+    bind_runs = {}
+    for idx, addrs in sorted(spec.rom_binds.items()):
+        num = sum(1 << rom for rom, addr in enumerate(addrs) if addr is not None)
+        run = bind_runs.setdefault(num, [])
+        if run and run[-1][0] != idx - 1: raise ValueError('bind entries of resource %d not consecutive' % num)
+        run.append((idx, addrs))
+
+    nums = {maxnum} | {m.num for m in spec.modules} | set(bind_runs)
+    nums = sorted(nums, key=_resource_order)
+
+    resources = {}
+    for num in nums:
+        if num & ~maxnum: raise ValueError('resource %d is not for these ROMs' % num)
+        if num == maxnum:
+            njt = max((m.jt + 1 + len(m.ents) for m in spec.modules), default=0)
+            if njt > 0xffff or len(spec.rom_binds) > 0xffff: raise ValueError('too many jump table or ROM address entries')
+            header = struct.pack('>HH', len(spec.rom_binds), njt)
+        elif len(bits(num)) == 1:
+            header = struct.pack('>H', sum(1 for n in nums if n & num))
+        else:
+            header = b''
+
+        modules = sorted((m for m in spec.modules if m.num == num), key=lambda m: m.jt)
+        exports = spec.jtpatches if num == maxnum else None
+        resources[num] = header + encode_resource(num, spec.nroms, modules, bind_runs.get(num, []), exports)
+
+    return resources
+
+
+# One 'lpch' after its header
+def encode_resource(num, nroms, modules, binds, exports):
+    # The code, with each ref's bytes replaced by the linker's data
+    code = bytearray()
+    starts = []
+    fixups = [] # (offset in code, bind_idx)
+    for m in modules:
+        starts.append(len(code))
+        mcode = bytearray(m.code)
+
+        coderefs = sorted(m.coderefs)
+        for i, (ofs, opcode, resident, targ_jt) in enumerate(coderefs):
+            link = (coderefs[i+1][0] - ofs) // 2 if i+1 < len(coderefs) else 0
+            if link > 0x7fff or targ_jt > 0xfff: raise ValueError('coderef at %d out of range' % ofs)
+            struct.pack_into('>L', mcode, ofs, bool(resident) << 31 | link << 16 | opcode << 12 | targ_jt)
+
+        fixups.extend((len(code) + ofs, bind_idx) for ofs, bind_idx in m.romrefs)
+        code += mcode
+
+    # Chain the ROM address slots into linked lists, starting a new list where a link would
+    # overflow, or would be zero (which ends the list) because the slots are back to back
+    fixups.sort()
+    links = [(fixups[i+1][0] - ofs - 4) // 2 for i, (ofs, _) in enumerate(fixups[:-1])] + [0]
+    links = [link if 0 < link <= 0xffff else 0 for link in links]
+    heads = []
+    for i, (ofs, bind_idx) in enumerate(fixups):
+        if i == 0 or links[i-1] == 0:
+            if ofs == 0: raise ValueError('ROM address at offset 0 would end the fixup lists')
+            heads.append(ofs)
+        struct.pack_into('>HH', code, ofs, links[i], bind_idx)
+
+    out = bytearray(struct.pack('>L', len(code)) + code)
+
+    # This resource's run of the ROM address table, the last address flagged
+    if binds:
+        out += struct.pack('>H', binds[0][0])
+        for i, (_, addrs) in enumerate(binds):
+            roms = list(reversed(bits(num)))
+            for j, rom in enumerate(roms):
+                addr = addrs[rom]
+                if addr & ~0x7fffff: raise ValueError('ROM address %x out of range' % addr)
+                if i == len(binds)-1 and j == len(roms)-1: addr |= 0x800000
+                out += addr.to_bytes(3, 'big')
+    else:
+        out += b'\xff\xff'
+
+    for head in heads: out += head.to_bytes(3, 'big')
+    out += b'\0\0\0'
+
+    out += _module_map(modules, starts, len(code))
+
+    if exports is not None:
+        out += _export_table(exports, nroms)
+
+    return bytes(out)
+
+
+# Module map bytecode: distances between module boundaries, ref list heads and entries
+def _module_map(modules, starts, codelen):
+    def distance(d):
+        return bytes([d // 2]) if d // 2 <= 251 else b'\xff' + struct.pack('>H', d)
+
+    def skip(n):
+        if n <= 0: return b''
+        return bytes([252, n]) if n <= 254 else b'\xfc\xff' + struct.pack('>H', n)
+
+    # (offset in code, kind): 0 for a module boundary, 1 for a ref list head, 2 for an entry
+    events = []
+    for i, m in enumerate(modules):
+        if i: events.append((starts[i], 0, i))
+        if m.coderefs: events.append((starts[i] + min(r[0] for r in m.coderefs), 1, None))
+        events.extend((starts[i] + ofs, 2, None) for ofs in m.ents)
+    if modules: events.append((codelen, 0, None))
+    events.sort()
+
+    out = bytearray()
+    if modules: out += skip(modules[0].jt)
+    pos = 0
+    for ofs, kind, i in events:
+        out += distance(ofs - pos)
+        pos = ofs
+        if kind == 1:
+            out += b'\xfd'
+        elif kind == 2:
+            out += b'\xfe'
+        elif i is not None:
+            prev = modules[i-1]
+            out += skip(modules[i].jt - (prev.jt + 1 + len(prev.ents)))
+    out += b'\xfc\x00'
+    return out
+
+
+# Export table: runs of (jt delta, trap) under each set of condition bits
+def _export_table(jtpatches, nroms):
+    cbytes = (nroms + len(lpch.CONDNAMES) + 7) // 8
+
+    runs = []
+    for jt, patches in sorted(jtpatches.items()):
+        for trap, condbits in patches:
+            if runs and runs[-1][0] == condbits:
+                runs[-1][1].append((jt, trap))
+            else:
+                runs.append((condbits, [(jt, trap)]))
+    if not runs: runs.append((0, []))
+
+    out = bytearray()
+    jt = 0
+    for i, (condbits, entries) in enumerate(runs):
+        out += condbits.to_bytes(cbytes, 'big')
+        for ejt, trap in entries:
+            delta = ejt - jt
+            jt = ejt
+            out += bytes([delta]) if delta < 254 else b'\xff' + struct.pack('>H', delta)
+            out += struct.pack('>H', trap)
+        out += b'\xfe' if i < len(runs)-1 else b'\xff\x00\x00'
+    return out
+
+
+# Wrap 'lpch' resources as a 'gpch'
+def encode_gpch(resources):
+    out = bytearray(b'\x00\x01' + bytes(14) + struct.pack('>H', len(resources)))
+    for num, data in sorted(resources.items(), key=lambda kv: _resource_order(kv[0])):
+        out += struct.pack('>hL', num, len(data)) + data
+    return bytes(out)
+
+
+# Describe a parsed patch set, so that it can be encoded again
+def describe(ps):
+    modules = []
+    for mjt, mod in sorted(ps.modtable.items(), key=lambda kv: (_resource_order(kv[1].num), kv[1].ofs)):
+        modules.append(ModuleSpec(
+            num=mod.num,
+            jt=mjt,
+            code=bytes(ps.resources[mod.num][mod.ofs:mod.end]),
+            ents=list(mod.ents),
+            coderefs=[(ofs, opcode, resident, targ_jt) for ofs, _, opcode, resident, targ_jt in mod.coderefs],
+            romrefs=[(start+length-4, bind_idx) for start, length, _, _, bind_idx in mod.romrefs],
+        ))
+
+    return PatchSpec(
+        nroms=ps.nroms,
+        modules=modules,
+        rom_binds={idx: list(addrs) for idx, addrs in ps.rom_binds.items()},
+        jtpatches={jt: list(patches) for jt, patches in ps.jtpatches.items() if patches},
+    )
+
+
+# Encode, parse and describe again. Returns a list of differences (empty if all is well).
+def roundtrip(spec):
+    got = describe(lpch.parse_lpch_set(encode_set(spec)))
+
+    errors = []
+    if got.rom_binds != spec.rom_binds: errors.append('rom_binds differ')
+    if got.jtpatches != {jt: patches for jt, patches in spec.jtpatches.items() if patches}: errors.append('jtpatches differ')
+
+    want_modules = {m.jt: m for m in spec.modules}
+    got_modules = {m.jt: m for m in got.modules}
+    for jt in sorted(want_modules.keys() | got_modules.keys()):
+        want, have = want_modules.get(jt), got_modules.get(jt)
+        if want is None or have is None:
+            errors.append('module %X %s' % (jt, 'missing' if have is None else 'unexpected'))
+            continue
+        if want.num != have.num:
+            errors.append('module %X num differs' % jt)
+        for field in ('ents', 'coderefs', 'romrefs'):
+            if sorted(getattr(want, field)) != sorted(getattr(have, field)):
+                errors.append('module %X %s differ' % (jt, field))
+        if _masked(want) != _masked(have):
+            errors.append('module %X code differs' % jt)
+
+    return errors
+
+
+# The module's code apart from the bytes that the encoder overwrites
+def _masked(m):
+    code = bytearray(m.code)
+    for ofs in [r[0] for r in m.coderefs] + [r[0] for r in m.romrefs]:
+        code[ofs:ofs+4] = bytes(4)
+    return bytes(code)
+
+
+# A made-up patch set. fixups is ROM references per byte of code, and the proportion
+# of modules in the all-ROMs resource is as in real System files.
+def synth(nmodules=200, nroms=5, fixups=0.02, seed=0):
+    rnd = random.Random(seed)
+    maxnum = (1 << nroms) - 1
+    nums = {maxnum} | {1 << rom for rom in range(nroms)} | {n for n in (0x3, 0x7, 0xb, 0x13) if n < maxnum}
+    nums = sorted(nums, key=_resource_order)
+
+    per_resource = {num: 0 for num in nums}
+    for i in range(nmodules):
+        per_resource[maxnum if rnd.random() < .6 else rnd.choice(nums)] += 1
+
+    rom_macros = list(lpch.ROM_MACROS) + [b''] # the bytes before each kind of ROM reference
+    old_macros = [prefix + b'\xac\xbd\xad\xfb' for prefix in lpch.ROM_MACROS] + [b'\xac\xbd\xad\xfb']
+
+    modules = []
+    binds = {num: [] for num in nums} # numbered in resource order at the end
+    nbinds = 0
+    jt = 0
+    for num in nums:
+        for i in range(per_resource[num]):
+            if jt: jt += rnd.choice((0, 0, 0, 1, 3)) if rnd.random() < .999 else 300 # gaps in the jump table
+            size = rnd.randrange(12, 400 if rnd.random() < .9 else 2000) * 2
+            code = bytearray(rnd.randbytes(size))
+            used = bytearray(size)
+
+            # Somewhere free for n bytes at an even offset, or None
+            def place(n, lo=0):
+                for attempt in range(8):
+                    ofs = rnd.randrange(lo, size - n + 1) & ~1
+                    if ofs >= lo and not any(used[ofs:ofs+n]):
+                        used[ofs:ofs+n] = b'\x01' * n
+                        return ofs
+
+            ents = sorted({rnd.randrange(1, size // 2) * 2 for _ in range(rnd.choice((0, 0, 1, 2)))})
+
+            coderefs = []
+            for _ in range(rnd.randrange(4)):
+                ofs = place(4)
+                if ofs is not None:
+                    coderefs.append((ofs, rnd.choice((0, 1, 7, 8, 9, 10, 15)), rnd.random() < .5, rnd.randrange(0x1000)))
+
+            romrefs = []
+            for _ in range(int(fixups * size + rnd.random())):
+                prefix = rnd.choice(rom_macros)
+                ofs = place(len(prefix) + 4, 2)
+                if ofs is None: continue
+                code[ofs:ofs+len(prefix)] = prefix
+                ofs += len(prefix)
+
+                if binds[num] and (rnd.random() < .5 or nbinds == 0xffff): # share an address with another reference
+                    romrefs.append((ofs, (num, rnd.randrange(len(binds[num])))))
+                elif nbinds < 0xffff:
+                    addrs = [None] * nroms
+                    for rom in bits(num): addrs[rom] = rnd.randrange(0x400000) * 2
+                    binds[num].append(addrs)
+                    nbinds += 1
+                    romrefs.append((ofs, (num, len(binds[num]) - 1)))
+
+            for _ in range(rnd.randrange(3)):
+                old = rnd.choice(old_macros)
+                ofs = place(len(old))
+                if ofs is not None: code[ofs:ofs+len(old)] = old
+
+            if rnd.random() < .3 and size >= 12 and not any(used[-12:]): # MacsBug name
+                code[-12:] = b'\x4e\x75\x87SYMNAM' + bytes([ord('A') + jt % 26]) + b'\0\0'
+
+            modules.append(ModuleSpec(num, jt, bytes(code), ents, coderefs, romrefs))
+            jt += 1 + len(ents)
+
+    # Number the bind entries, resource by resource
+    first = {}
+    rom_binds = {}
+    for num in nums:
+        first[num] = len(rom_binds)
+        for addrs in binds[num]:
+            rom_binds[len(rom_binds)] = addrs
+    modules = [m._replace(romrefs=[(ofs, first[num] + i) for ofs, (num, i) in m.romrefs]) for m in modules]
+
+    jtpatches = {}
+    for m in modules:
+        if rnd.random() < .5:
+            for _ in range(rnd.choice((1, 1, 2))):
+                condbits = m.num | rnd.choice((0, 0, 1, 2, 3)) << nroms
+                trap = rnd.choice((0, 0xa046, 0xa9a0 + rnd.randrange(64)))
+                jtpatches.setdefault(m.jt, []).append((trap, condbits))
+
+    return PatchSpec(nroms, modules, rom_binds, jtpatches)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='''
+        Write a made-up patch set as lpch/NNN files and a gpch, for benchmarks and fuzzing.
+    ''')
+    parser.add_argument('dest', action='store', metavar='DIR')
+    parser.add_argument('-n', action='store', type=int, default=200, help='number of modules (default: %(default)s)')
+    parser.add_argument('--roms', action='store', type=int, default=5, help='number of ROMs (default: %(default)s)')
+    parser.add_argument('--fixups', action='store', type=float, default=0.02, help='ROM references per byte of code (default: %(default)s)')
+    parser.add_argument('--seed', action='store', type=int, default=0)
+    parser.add_argument('--check', action='store_true', help='check that the set parses back to what was written')
+    args = parser.parse_args()
+
+    spec = synth(args.n, args.roms, args.fixups, args.seed)
+    resources = encode_set(spec)
+
+    os.makedirs(path.join(args.dest, 'lpch'), exist_ok=True)
+    for num, data in resources.items():
+        with open(path.join(args.dest, 'lpch', str(num)), 'wb') as f:
+            f.write(data)
+    with open(path.join(args.dest, 'gpch'), 'wb') as f:
+        f.write(encode_gpch(resources))
+
+    if args.check:
+        errors = roundtrip(spec)
+        for error in errors: print(error)
+        raise SystemExit(1 if errors else 0)
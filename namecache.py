@@ -0,0 +1,83 @@
+# The module name cache (-c): proquints from an earlier run -> the linker's name for that module.
+# Lets a System without a linker listing borrow names learned from one that had it.
+#
+# A path ending in .sqlite or .db is an SQLite database, which is the better choice when many
+# processes share one cache. Anything else is the original text format, one "proquint name" per
+# line. Either way the whole table is read into a dict up front, and update() only adds new or
+# changed names, merging with whatever other processes have written since.
+
+import fcntl
+import os
+import sqlite3
+
+
+def open_cache(path):
+    if path.endswith(('.sqlite', '.db')):
+        return SqliteNameCache(path)
+    else:
+        return TextNameCache(path)
+
+
+class TextNameCache:
+    def __init__(self, path):
+        self.path = path
+        self.names = self._read()
+
+    def get(self, pq, default=None):
+        return self.names.get(pq, default)
+
+    def _read(self):
+        names = {}
+        try:
+            with open(self.path) as f:
+                for l in f:
+                    l = l.split()
+                    if len(l) == 2:
+                        names[l[0]] = l[1]
+        except FileNotFoundError:
+            pass
+        return names
+
+    def update(self, new):
+        if all(self.names.get(pq) == name for pq, name in new.items()): return
+
+        # Re-read under the lock so that concurrent writers do not lose each other's names
+        with open(self.path + '.lock', 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            names = self._read()
+            names.update(new)
+
+            tmp_path = self.path + '.%d' % os.getpid()
+            with open(tmp_path, 'w') as f:
+                for pq, name in names.items():
+                    print(pq, name, file=f)
+            os.replace(tmp_path, self.path)
+
+        self.names = names
+
+    def close(self):
+        pass
+
+
+class SqliteNameCache:
+    def __init__(self, path):
+        self.db = sqlite3.connect(path, timeout=60)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('CREATE TABLE IF NOT EXISTS names (pq TEXT PRIMARY KEY, name TEXT NOT NULL)')
+        self.db.commit()
+        self.names = dict(self.db.execute('SELECT pq, name FROM names'))
+
+    def get(self, pq, default=None):
+        return self.names.get(pq, default)
+
+    def update(self, new):
+        changed = [(pq, name) for pq, name in new.items() if self.names.get(pq) != name]
+        if not changed: return
+
+        with self.db:
+            self.db.executemany('INSERT OR REPLACE INTO names (pq, name) VALUES (?, ?)', changed)
+        self.names.update(changed)
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,104 @@
+# On-disk cache of the first pass, keyed by a hash of the 'lpch' resources.
+# Only naming (-l, -c, --lib) and the listing need to run again when the inputs are unchanged.
+#
+# Each entry is the PatchSet minus its resource data, as plain tuples, lists and dicts in marshal
+# format, which (unlike pickle) cannot run code when loaded, so the directory can be shared.
+# Entries are written atomically, touched when used, and the least recently used are deleted
+# when the directory grows too big. An entry that cannot be read for any reason is a miss.
+
+import hashlib
+import marshal
+import os
+from os import path
+
+import lpch
+import romlocs
+from stats import NO_STATS
+
+
+# Bump this whenever the first pass changes what it produces, or the entries change shape
+VERSION = 2
+
+DEFAULT_MAX_BYTES = 256 << 20
+
+
+# Everything that the first pass output depends on
+def cache_key(resources):
+    st = os.stat(romlocs.TABLE) # module hashes depend on ROMLOCS
+    h = hashlib.sha256(b'lpch parse cache %d %d %d %d' % (VERSION, marshal.version, st.st_size, st.st_mtime_ns))
+    for num, data in sorted(resources.items()):
+        h.update(b'%d %d\n' % (num, len(data)))
+        h.update(data)
+    return h.hexdigest()
+
+
+# Drop-in replacement for lpch.parse_lpch_set
+def parse_lpch_set(resources, cache_dir, max_bytes=DEFAULT_MAX_BYTES, stats=None):
+    entry_path = path.join(cache_dir, cache_key(resources) + '.marshal')
+    stats = stats or NO_STATS
+    stats.count('parse cache lookups')
+
+    try:
+        with open(entry_path, 'rb') as f:
+            ps = _restore(lpch.PatchSet(resources, stats), marshal.load(f))
+        os.utime(entry_path) # most recently used
+    except Exception: # missing, truncated, stale or not ours: parse again
+        ps = None
+
+    stats.count('parse cache hits', 0 if ps is None else 1) # even a miss, for a hit rate of 0%
+    if ps is not None:
+        return ps
+
+    ps = lpch.parse_lpch_set(resources, stats)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = entry_path + '.%d' % os.getpid()
+    with open(tmp_path, 'wb') as f:
+        marshal.dump(_saved(ps), f)
+    os.replace(tmp_path, entry_path)
+
+    evict(cache_dir, max_bytes)
+    return ps
+
+
+# The first pass output as marshal can write it. Each romref's ROM addresses are
+# rom_binds[bind_idx], so they are left out and put back by _restore.
+def _saved(ps):
+    return dict(
+        modtable={mjt: (num, ofs, end, ents, coderefs, [(start, length, macroname, bind_idx) for start, length, macroname, _, bind_idx in romrefs], oldrefs)
+            for mjt, (num, ofs, end, ents, coderefs, romrefs, oldrefs) in ps.modtable.items()},
+        rom_binds=ps.rom_binds,
+        jtpatches=dict(ps.jtpatches),
+        namedb=ps.namedb,
+    )
+
+
+def _restore(ps, saved):
+    ps.rom_binds = saved['rom_binds']
+    for mjt, (num, ofs, end, ents, coderefs, romrefs, oldrefs) in saved['modtable'].items():
+        romrefs = [(start, length, macroname, ps.rom_binds[bind_idx], bind_idx) for start, length, macroname, bind_idx in romrefs]
+        ps.modtable[mjt] = lpch.Module(num, ofs, end, ents, coderefs, romrefs, oldrefs)
+    ps.jtpatches.update(saved['jtpatches'])
+    ps.namedb = saved['namedb']
+    return ps
+
+
+# Delete least recently used entries until the cache fits
+def evict(cache_dir, max_bytes):
+    entries = []
+    for fn in os.listdir(cache_dir):
+        if not fn.endswith('.marshal'): continue
+        try:
+            st = os.stat(path.join(cache_dir, fn))
+        except OSError:
+            continue # another process got there first
+        entries.append((st.st_mtime, st.st_size, fn))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, fn in sorted(entries):
+        if total <= max_bytes: break
+        try:
+            os.remove(path.join(cache_dir, fn))
+        except OSError:
+            pass
+        total -= size
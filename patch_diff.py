@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+# Compare the patch sets of two System versions module by module, joining on the module hash
+# (the CRC that names modules like 'jivisoh') instead of diffing listings, whose offsets all shift.
+#
+# A module with the same hash on both sides is unchanged, or moved if its resource differs.
+# One that only changed jump table index is merely shifted, as everything after an insertion
+# is, and these are counted rather than listed (unless asked for). The rest are paired by name
+# where the name is real (from the linker, MacsBug or the module name cache), or else with the
+# module of the same resource that shares the most patched traps and ROM references, if enough
+# of them, and reported as changed. What is left over is added or removed.
+# Trap patches (PatchProc/InstallProc and their conditions) are compared for each pair.
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter, defaultdict
+from os import path
+
+import lpch
+import namecache
+
+
+# What the diff needs to know about each module
+def _modules(ps):
+    mods = []
+    for mjt, mod in sorted(ps.modtable.items()):
+        patches = set()
+        for i in range(1 + len(mod.ents)):
+            for trap, condbits in ps.jtpatches.get(mjt + i, ()):
+                patches.add((i, trap, ps.condstr(condbits)))
+
+        mods.append(dict(
+            jt=mjt,
+            name=ps.getname(mjt),
+            real_name=ps.namesource(mjt) in ('linker', 'macsbug', 'cache'),
+            hash=ps.namedb.get(mjt, [None, None, None])[2],
+            resource=ps.condstr(mod.num),
+            size=mod.end - mod.ofs,
+            patches=patches,
+            romrefs={tuple(romaddrs) for _, _, _, romaddrs, _ in mod.romrefs},
+        ))
+    return mods
+
+
+# What pairs up two modules whose code differs: the traps they patch and the ROM addresses they use
+def _features(m):
+    return {('trap', trap) for _, trap, _ in m['patches'] if trap} | {('rom', addrs) for addrs in m['romrefs']}
+
+
+# How alike two modules must be to pair up as changed. Common traps and ROM routines are shared
+# by many unrelated modules, so one feature in common is not enough: they must share at least
+# MIN_SHARED features and this fraction of all their features (Jaccard), and be of similar size.
+MIN_SHARED = 2
+MIN_LIKENESS = 0.5
+MIN_SIZE_RATIO = 0.5
+
+
+def _alike(old, new, shared):
+    likeness = shared / len(_features(old) | _features(new))
+    size_ratio = min(old['size'], new['size']) / max(old['size'], new['size'], 1)
+    return shared >= MIN_SHARED and likeness >= MIN_LIKENESS and size_ratio >= MIN_SIZE_RATIO
+
+
+# Returns {'moved': [(old, new)], 'shifted': [(old, new)], 'changed': [(old, new)], 'added': [new],
+# 'removed': [old], 'patches': [(old, new)], 'unchanged': count}, where old and new are dicts from _modules
+def diff(old_ps, new_ps):
+    old_mods, new_mods = _modules(old_ps), _modules(new_ps)
+
+    # Hash join, pairing duplicates in jump table order
+    by_hash = defaultdict(list)
+    for m in new_mods: by_hash[m['hash']].append(m)
+    pairs = []
+    old_left = []
+    for m in old_mods:
+        if by_hash.get(m['hash']):
+            pairs.append((m, by_hash[m['hash']].pop(0)))
+        else:
+            old_left.append(m)
+    new_left = sorted((m for ms in by_hash.values() for m in ms), key=lambda m: m['jt'])
+
+    result = dict(moved=[], shifted=[], changed=[], added=[], removed=[], patches=[], unchanged=0)
+    paired = set() # ids of the new modules paired by name or likeness
+    for old, new in pairs:
+        if old['resource'] != new['resource']:
+            result['moved'].append((old, new))
+        elif old['jt'] != new['jt']:
+            result['shifted'].append((old, new))
+        else:
+            result['unchanged'] += 1
+
+    # Then pair what is left by name, where the name means something
+    by_name = {m['name']: m for m in new_left if m['real_name']}
+    unnamed = []
+    for old in old_left:
+        new = by_name.get(old['name']) if old['real_name'] else None
+        if new is None or id(new) in paired:
+            unnamed.append(old)
+        else:
+            result['changed'].append((old, new))
+            pairs.append((old, new))
+            paired.add(id(new))
+
+    # And failing that with the most alike module of the same resource, if any is alike enough
+    # (jump table indices shift between versions, so the same index means nothing)
+    by_feature = defaultdict(list)
+    for m in new_left:
+        if id(m) not in paired:
+            for f in _features(m): by_feature[(m['resource'], f)].append(m)
+    for old in unnamed:
+        shared = Counter()
+        candidates = {}
+        for f in _features(old):
+            for m in by_feature.get((old['resource'], f), ()):
+                if id(m) not in paired:
+                    shared[id(m)] += 1
+                    candidates[id(m)] = m
+        candidates = [m for m in candidates.values() if _alike(old, m, shared[id(m)])]
+        if candidates:
+            new = max(candidates, key=lambda m: (shared[id(m)], -abs(m['jt'] - old['jt'])))
+            result['changed'].append((old, new))
+            pairs.append((old, new))
+            paired.add(id(new))
+        else:
+            result['removed'].append(old)
+    result['added'] = [m for m in new_left if id(m) not in paired]
+
+    for old, new in pairs:
+        if old['patches'] != new['patches']:
+            result['patches'].append((old, new))
+
+    return result
+
+
+def _label(m):
+    return '%s (%03X)' % (m['name'], m['jt'])
+
+
+def _patchstr(patch):
+    i, trap, conds = patch
+    proc = 'PatchProc $%X,%s' % (trap, conds) if trap else 'InstallProc %s' % conds
+    return proc + (' at entry %d' % i if i else '')
+
+
+# The report, one line per difference (and per shifted module, if shifts)
+def report_lines(result, shifts=False):
+    for old, new in result['moved']:
+        where = []
+        if old['jt'] != new['jt']: where.append('%03X -> %03X' % (old['jt'], new['jt']))
+        where.append('%s -> %s' % (old['resource'], new['resource']))
+        yield 'moved    %s: %s' % (old['name'], ', '.join(where))
+    if shifts:
+        for old, new in result['shifted']:
+            yield 'shifted  %s: %03X -> %03X' % (old['name'], old['jt'], new['jt'])
+    for old, new in result['changed']:
+        yield 'changed  %s -> %s, %d -> %d bytes' % (_label(old), _label(new), old['size'], new['size'])
+    for m in result['removed']:
+        yield 'removed  %s, %d bytes' % (_label(m), m['size'])
+    for m in result['added']:
+        yield 'added    %s, %d bytes' % (_label(m), m['size'])
+    for old, new in result['patches']:
+        for patch in sorted(old['patches'] - new['patches']):
+            yield 'patches  %s: - %s' % (new['name'], _patchstr(patch))
+        for patch in sorted(new['patches'] - old['patches']):
+            yield 'patches  %s: + %s' % (new['name'], _patchstr(patch))
+
+
+def report_json(result, shifts=False):
+    def mod(m):
+        return dict(jt=m['jt'], name=m['name'], hash='%08x' % m['hash'] if m['hash'] is not None else None,
+            resource=m['resource'], size=m['size'])
+
+    def patches(ps):
+        return [dict(entry=i, trap=trap, conds=conds) for i, trap, conds in sorted(ps)]
+
+    return dict(
+        unchanged=result['unchanged'],
+        shifted=[dict(old=mod(old), new=mod(new)) for old, new in result['shifted']] if shifts else len(result['shifted']),
+        moved=[dict(old=mod(old), new=mod(new)) for old, new in result['moved']],
+        changed=[dict(old=mod(old), new=mod(new)) for old, new in result['changed']],
+        removed=[mod(m) for m in result['removed']],
+        added=[mod(m) for m in result['added']],
+        patches=[dict(old=mod(old), new=mod(new), removed=patches(old['patches'] - new['patches']),
+            added=patches(new['patches'] - old['patches'])) for old, new in result['patches']],
+    )
+
+
+# A directory of lpch files, or a single System file or gpch
+def _parse(src, gpch, names_path, pq_cache):
+    paths = sorted(path.join(src, fn) for fn in os.listdir(src)) if path.isdir(src) else [src]
+    ps = lpch.parse_files(paths, gpch)
+    if pq_cache is not None:
+        ps.pq_cache = pq_cache
+    if names_path:
+        lpch.read_linker_names(ps, names_path)
+    return ps
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='''
+        Compare the patch sets of two System versions: modules added, removed, moved
+        and changed, and changes to which traps they patch under which conditions.
+    ''')
+    parser.add_argument('old', action='store', metavar='OLD', help='System file, gpch, or directory of lpch files')
+    parser.add_argument('new', action='store', metavar='NEW')
+    parser.add_argument('--old-gpch', action='store', type=int, metavar='N', help='which gpch of OLD')
+    parser.add_argument('--new-gpch', action='store', type=int, metavar='N', help='which gpch of NEW')
+    parser.add_argument('--old-names', action='store', metavar='FILE', help='module names of OLD (from LinkedPatch -l)')
+    parser.add_argument('--new-names', action='store', metavar='FILE', help='module names of NEW (from LinkedPatch -l)')
+    parser.add_argument('-c', action='store', help='module name cache (text, or SQLite if named *.sqlite)')
+    parser.add_argument('--json', action='store_true', help='print the differences as JSON')
+    parser.add_argument('--shifts', action='store_true', help='list the modules that only changed jump table index, not just count them')
+    args = parser.parse_args()
+
+    pq_cache = namecache.open_cache(args.c) if args.c else None
+    old_ps = _parse(args.old, args.old_gpch, args.old_names, pq_cache)
+    new_ps = _parse(args.new, args.new_gpch, args.new_names, pq_cache)
+
+    result = diff(old_ps, new_ps)
+    if args.json:
+        json.dump(report_json(result, args.shifts), sys.stdout, indent=1)
+        print()
+    else:
+        for l in report_lines(result, args.shifts): print(l)
+        print('%d unchanged, %d shifted, %d moved, %d changed, %d removed, %d added, %d with different patches' % (
+            result['unchanged'], len(result['shifted']), len(result['moved']), len(result['changed']),
+            len(result['removed']), len(result['added']), len(result['patches'])), file=sys.stderr)
+
+    if pq_cache is not None:
+        pq_cache.close()
@@ -0,0 +1,84 @@
+# Names of ROM references, from the MPW object library that the Linked Patches were linked from.
+# Each jsrROM etc. leaves a ROM$name$ symbol in the library. The linker numbers the bound ROM
+# addresses in the order it first meets each name, so the Nth distinct name is a guess at
+# rom_binds[N]. Only a guess: the library also holds objects that were never linked, the link
+# order is hard to reproduce (see order_rom_refs.py), and the binds are numbered resource by
+# resource. So attach() checks the names against ROMLOCS before a PatchSet believes them.
+#
+# Scanning a multi-megabyte library takes a while, so the names are cached in a small text file
+# beside it (LinkedPatches.lib.romnames), which is trusted while the library's size and mtime match.
+
+import os
+import re
+
+import romlocs
+
+
+ROM_SYMBOL_RE = rb'ROM\$([_A-Za-z][_A-Za-z0-9@%]*)\$'
+
+# The share of the bind entries named by ROMLOCS that must have the same name in the library
+MIN_AGREEMENT = 0.9
+
+
+# Distinct ROM reference names in order of first appearance
+def scan(lib_bytes):
+    names = {}
+    for m in re.finditer(ROM_SYMBOL_RE, lib_bytes):
+        names.setdefault(m.group(1).decode('mac_roman'), None)
+    return list(names)
+
+
+def read(lib_path):
+    st = os.stat(lib_path)
+    key = '# %d %d' % (st.st_size, st.st_mtime_ns)
+    cache_path = lib_path + '.romnames'
+
+    try:
+        with open(cache_path) as f:
+            lines = f.read().splitlines()
+        if lines and lines[0] == key:
+            return lines[1:]
+    except OSError:
+        pass
+
+    with open(lib_path, 'rb') as f:
+        lib_bytes = f.read()
+    if not lib_bytes.startswith(b'\x01'): raise ValueError('%r not an MPW object file' % lib_path)
+    names = scan(lib_bytes)
+
+    try:
+        tmp_path = cache_path + '.%d' % os.getpid()
+        with open(tmp_path, 'w') as f:
+            f.write('\n'.join([key] + names) + '\n')
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass # read-only directory: just rescan next time
+
+    return names
+
+
+# Give a PatchSet the names of its ROM references, if they fit its bind table. A list with fewer
+# names than bind entries is refused. Otherwise the names are kept for where ROMLOCS has nothing
+# to say, and believed only if they agree with ROMLOCS where it does (see PatchSet.romaddrsym).
+# Returns None if the names are believed, or why not.
+def attach(ps, names):
+    nbinds = max(ps.rom_binds) + 1 if ps.rom_binds else 0
+    if len(names) < nbinds:
+        return 'refused: %d names for %d ROM addresses' % (len(names), nbinds)
+
+    agree = disagree = 0
+    for idx, romaddrs in ps.rom_binds.items():
+        known = set()
+        for romname, romaddr in zip(ps.condnames, romaddrs):
+            found = romlocs.lookup(romname, romaddr) if romaddr is not None else None
+            if found: known.add(found.lower())
+        if known:
+            if names[idx].lower() in known:
+                agree += 1
+            else:
+                disagree += 1
+
+    ps.rom_names = names
+    ps.rom_names_checked = agree > 0 and agree >= MIN_AGREEMENT * (agree + disagree)
+    if not ps.rom_names_checked:
+        return 'doubtful: %d of %d ROM addresses known to ROMLOCS have the same name in the library' % (agree, agree + disagree)
@@ -0,0 +1,42 @@
+# Known ROM locations, for naming references to them in the Linked Patches.
+# The table itself is in romlocs.txt. It is only read on the first lookup,
+# because many resources never need it, and it is kept as a sorted array of
+# offsets per ROM with a parallel list of names, which is far smaller than
+# a dict of tuples.
+
+import bisect
+from array import array
+from os import path
+
+
+TABLE = path.join(path.dirname(path.abspath(__file__)), 'romlocs.txt')
+
+_index = None # _index[romname] = (array of sorted offsets, list of names)
+
+
+def _load():
+    global _index
+
+    merged = {}
+    with open(TABLE) as f:
+        for l in f:
+            l = l.partition('#')[0].split()
+            if not l: continue
+            romname, romaddr, name = l
+            merged.setdefault(romname, {})[int(romaddr, 16)] = name
+
+    index = {}
+    for romname, locs in merged.items():
+        addrs = sorted(locs)
+        index[romname] = (array('L', addrs), [locs[a] for a in addrs])
+
+    _index = index
+    return index
+
+
+# The symbol at this ROM offset, or None
+def lookup(romname, romaddr):
+    addrs, names = (_index or _load()).get(romname, ((), ()))
+    i = bisect.bisect_left(addrs, romaddr)
+    if i < len(addrs) and addrs[i] == romaddr:
+        return names[i]
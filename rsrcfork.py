@@ -0,0 +1,164 @@
+# Read resources straight out of a System file, so that rfx is not needed.
+# Understands raw resource forks (including macOS's path/..namedfork/rsrc), AppleSingle and
+# AppleDouble, MacBinary, BinHex 4.0, and the Rez text that DeRez and rfx write.
+#
+# read_resources(path) returns {(type, id): data}, with type as a 4-byte bytes object,
+# or None if the file is none of these. The data are memoryviews into the mapped file where possible.
+
+import binascii
+import mmap
+import os
+import re
+import struct
+
+
+def read_resources(path, data=None):
+    if data is None:
+        data = map_file(path)
+
+    resources = parse_container(data)
+    if resources is None and os.path.exists(os.path.join(path, '..namedfork', 'rsrc')):
+        resources = parse_fork(map_file(os.path.join(path, '..namedfork', 'rsrc')))
+
+    return resources
+
+
+# A read-only memoryview of the whole file, which slices without copying
+def map_file(path):
+    with open(path, 'rb') as f:
+        try:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except (ValueError, OSError): # empty, or not a regular file
+            return memoryview(f.read())
+
+
+# Whichever format this is, get the resources out of it
+def parse_container(data):
+    fork = None
+
+    if data[:4] in (b'\x00\x05\x16\x00', b'\x00\x05\x16\x07'):
+        fork = applesingle_fork(data)
+    elif b'(This file must be converted with BinHex' in bytes(data[:1024]):
+        fork = binhex_fork(data)
+    elif re.match(rb'\s*(/\*.*?\*/\s*)*data\s', data[:4096], re.DOTALL):
+        return parse_rez(data)
+    elif is_macbinary(data):
+        dlen, rlen = struct.unpack_from('>LL', data, 83)
+        rofs = 128 + (dlen + 127) // 128 * 128
+        fork = data[rofs:rofs+rlen]
+    else:
+        fork = data
+
+    return parse_fork(fork) if fork is not None else None
+
+
+def applesingle_fork(data):
+    count, = struct.unpack_from('>H', data, 24)
+    for i in range(count):
+        entry_id, ofs, length = struct.unpack_from('>LLL', data, 26 + 12*i)
+        if entry_id == 2: # resource fork
+            return data[ofs:ofs+length]
+
+
+def is_macbinary(data):
+    if len(data) < 128 or data[0] != 0 or data[74] != 0 or data[82] != 0: return False
+    if not 1 <= data[1] <= 63: return False
+    dlen, rlen = struct.unpack_from('>LL', data, 83)
+    if 128 + dlen + rlen > len(data) + 256: return False
+    crc, = struct.unpack_from('>H', data, 124)
+    return crc == 0 or crc == binascii.crc_hqx(data[:124], 0) # MacBinary I has no CRC
+
+
+BINHEX_CHARS = b'!"#$%&\'()*+,-012345689@ABCDEFGHIJKLMNPQRSTUVXYZ[`abcdefhijklmpqr'
+
+
+def binhex_fork(data):
+    data = bytes(data)
+    data = data[data.index(b'(This file must be converted with BinHex'):]
+    start = data.index(b':') + 1
+    end = data.index(b':', start)
+
+    # 6-bit decode
+    table = {c: i for i, c in enumerate(BINHEX_CHARS)}
+    bits = 0
+    nbits = 0
+    packed = bytearray()
+    for c in data[start:end]:
+        if c in b'\r\n\t ': continue
+        bits = bits << 6 | table[c]
+        nbits += 6
+        if nbits >= 8:
+            nbits -= 8
+            packed.append(bits >> nbits & 0xff)
+    # (trailing bits are padding)
+
+    # Run-length decode: 0x90 nn repeats the previous byte nn-1 more times, 0x90 00 is a literal 0x90
+    out = bytearray()
+    i = 0
+    while i < len(packed):
+        c = packed[i]; i += 1
+        if c == 0x90 and i < len(packed):
+            n = packed[i]; i += 1
+            if n == 0:
+                out.append(0x90)
+            else:
+                out.extend(out[-1:] * (n - 1))
+        else:
+            out.append(c)
+
+    namelen = out[0]
+    ofs = 1 + namelen + 1 + 4 + 4 + 2
+    dlen, rlen = struct.unpack_from('>LL', out, ofs); ofs += 8
+    if binascii.crc_hqx(out[:ofs], 0) != struct.unpack_from('>H', out, ofs)[0]:
+        raise ValueError('BinHex header CRC mismatch')
+    ofs += 2 + dlen + 2
+    fork = bytes(out[ofs:ofs+rlen])
+    if binascii.crc_hqx(fork, 0) != struct.unpack_from('>H', out, ofs+rlen)[0]:
+        raise ValueError('BinHex resource fork CRC mismatch')
+    return fork
+
+
+# The resource map as described in Inside Macintosh: More Macintosh Toolbox, 1-121
+def parse_fork(fork):
+    try:
+        return _parse_fork(fork)
+    except struct.error:
+        return None # not a resource fork after all
+
+
+def _parse_fork(fork):
+    if len(fork) < 16: return None
+    dataofs, mapofs, datalen, maplen = struct.unpack_from('>LLLL', fork)
+    if not (16 <= dataofs and dataofs + datalen <= len(fork) and mapofs + maplen <= len(fork) and maplen >= 30):
+        return None
+
+    typelistofs, namelistofs = struct.unpack_from('>HH', fork, mapofs + 24)
+    typelist = mapofs + typelistofs
+    if typelist + 2 > len(fork): return None
+
+    resources = {}
+    ntypes = (struct.unpack_from('>H', fork, typelist)[0] + 1) & 0xffff
+    for i in range(ntypes):
+        rtype, nres, reflistofs = struct.unpack_from('>4sHH', fork, typelist + 2 + 8*i)
+        for j in range(nres + 1):
+            rid, nameofs, attrs_and_ofs = struct.unpack_from('>hHL', fork, typelist + reflistofs + 12*j)
+            ofs = dataofs + (attrs_and_ofs & 0xffffff)
+            length, = struct.unpack_from('>L', fork, ofs)
+            if ofs + 4 + length > len(fork): return None
+            resources[(rtype, rid)] = fork[ofs+4:ofs+4+length]
+
+    return resources
+
+
+REZ_DATA_RE = rb"""data\s+'((?:[^'\\]|\\.)+)'\s*\(\s*(-?\d+)[^)]*\)\s*\{((?:\s|\$"[0-9A-Fa-f\s]*"|/\*.*?\*/)*)\};"""
+
+
+# DeRez output, like:  data 'lpch' (31, sysheap, locked) { $"0001 0203" /* .... */ };
+def parse_rez(text):
+    resources = {}
+    for m in re.finditer(REZ_DATA_RE, text, re.DOTALL):
+        rtype = re.sub(rb'\\(0x[0-9A-Fa-f]{2}|.)', lambda e: bytes([int(e.group(1), 16)]) if len(e.group(1)) > 1 else e.group(1), m.group(1))
+        body = re.sub(rb'/\*.*?\*/', b'', m.group(3), flags=re.DOTALL)
+        hexdigits = b''.join(re.findall(rb'\$"([0-9A-Fa-f\s]*)"', body))
+        resources[(rtype, int(m.group(2)))] = bytes.fromhex(hexdigits.decode('ascii'))
+    return resources
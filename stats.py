@@ -0,0 +1,102 @@
+# Where the time goes: wall and CPU seconds spent in each named stage of a run, and counters
+# of the work done, for bench.py and patch_rip.py --stats.
+#
+# Stages nest, and each stage is charged only for its own time, not that of the stages inside it,
+# so the figures add up to the whole run. Parsing code times itself through ps.stats, which is
+# NO_STATS (doing nothing) unless a Stats is passed in.
+#
+# Stats(profile=[stage, ...]) also runs cProfile over those stages ('all' for every stage),
+# for print_profile() to show afterwards.
+
+import cProfile
+import json
+import pstats
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+
+
+class Stats:
+    def __init__(self, profile=()):
+        self.seconds = defaultdict(float) # seconds[stage] = wall time spent in it, excluding inner stages
+        self.cpu_seconds = defaultdict(float) # the same in CPU time
+        self.counts = Counter() # counts[what] = how many, as counted by count()
+        self._inner = [] # [wall, cpu] time spent in inner stages, for each stage that is running
+        self._start = time.perf_counter(), time.process_time()
+
+        self.profile = set(profile)
+        self.profiler = cProfile.Profile() if profile else None
+        self._profiling = False
+
+    @contextmanager
+    def stage(self, name):
+        profile = self.profiler is not None and not self._profiling and (name in self.profile or 'all' in self.profile)
+        if profile:
+            self._profiling = True
+            self.profiler.enable()
+
+        self._inner.append([0.0, 0.0])
+        start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            elapsed, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+            inner, inner_cpu = self._inner.pop()
+            self.seconds[name] += elapsed - inner
+            self.cpu_seconds[name] += cpu - inner_cpu
+            if self._inner:
+                self._inner[-1][0] += elapsed
+                self._inner[-1][1] += cpu
+
+            if profile:
+                self.profiler.disable()
+                self._profiling = False
+
+    def count(self, what, n=1):
+        self.counts[what] += n
+
+    # Everything as plain data, with a hit rate for each pair of counters 'X hits' and 'X lookups'
+    def as_dict(self):
+        rates = {}
+        for what, hits in self.counts.items():
+            if what.endswith(' hits'):
+                lookups = self.counts[what[:-len(' hits')] + ' lookups']
+                rates[what[:-len(' hits')] + ' hit rate'] = hits / lookups if lookups else None
+
+        return dict(
+            seconds=time.perf_counter() - self._start[0],
+            cpu_seconds=time.process_time() - self._start[1],
+            stages={name: dict(seconds=self.seconds[name], cpu_seconds=self.cpu_seconds[name]) for name in self.seconds},
+            counts=dict(self.counts),
+            rates=rates,
+        )
+
+    def print_report(self, file):
+        d = self.as_dict()
+        print('%-14s %10s %10s' % ('stage', 'wall ms', 'cpu ms'), file=file)
+        for name, stage in sorted(d['stages'].items(), key=lambda kv: -kv[1]['seconds']):
+            print('%-14s %10.1f %10.1f' % (name, stage['seconds']*1e3, stage['cpu_seconds']*1e3), file=file)
+        print('%-14s %10.1f %10.1f' % ('total', d['seconds']*1e3, d['cpu_seconds']*1e3), file=file)
+        for what, n in sorted(d['counts'].items()):
+            print('%-24s %10d' % (what, n), file=file)
+        for what, rate in sorted(d['rates'].items()):
+            print('%-24s %10s' % (what, '-' if rate is None else '%.1f%%' % (rate * 100)), file=file)
+
+    def write_json(self, file):
+        json.dump(self.as_dict(), file, indent=1)
+        file.write('\n')
+
+    def print_profile(self, file, limit=30):
+        if self.profiler is None: return
+        pstats.Stats(self.profiler, stream=file).sort_stats('cumulative').print_stats(limit)
+
+
+class _NoStats:
+    def stage(self, name):
+        return nullcontext()
+
+    def count(self, what, n=1):
+        pass
+
+
+NO_STATS = _NoStats()
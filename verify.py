@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+# Check a fresh parse against a reference dump like definitive.txt, annotation by annotation,
+# instead of diffing whole listings. Each annotation line of the reference, like
+#
+#   31:0009e:                                    (PROC 004 LOADPROCESSMANAGERSEGMENTSLOWERI)
+#   31:0009e:                                    $0,(Plus,SE,II,Portable,IIci)
+#   31:000ca:                          (leaResident 014 GETBUGFIXES,A0)
+#   31:00688:                     ((Plus,$11ac),(SE,$13f4),(II,$2186),(Portable,$386c),(IIci,$27c0))
+#
+# is indexed by (resource, offset from the start of its code), and the same is built from the
+# PatchSet. Hex lines are skipped. Names are checked only where the parse has the linker's name.
+
+import argparse
+import re
+import sys
+from collections import Counter, defaultdict
+
+import lpch
+
+
+LINE_RE = re.compile(r'(\d+):([0-9a-f]+): *(.*?)\s*$')
+REF_RE = re.compile(r'\((PROC|ENTRY|lea|pea|jsr|jmp|dcImport|opcode\d+)(Resident)?\s+([0-9A-F]+)(?:\s+([^\s,)]+))?(?:,(\w+))?\)$')
+PATCH_RE = re.compile(r'\$([0-9A-F]+),(\(.*\))$')
+ROM_RE = re.compile(r'\(\(.*\)\)$')
+CONDS_RE = re.compile(r'[A-Z]\w*(,[A-Z]\w*)*$')
+
+# Coderef opcodes as the reference spells them, with the register for lea
+OPCODES = ['lea'] * 8 + ['pea', 'jsr', 'jmp', 'opcode11', 'opcode12', 'opcode13', 'opcode14', 'dcImport']
+
+
+# Annotations are tuples, so that they can be counted:
+#   ('CONDS', 'Plus,SE,II'), ('PROC', jt), ('ENTRY', jt), ('PATCH', trap, '(Plus,SE,notVM)'),
+#   (opcode, resident, jt, register or None), ('ROM', '((Plus,$11ac),...)')
+# Returns ({(num, ofs): Counter of annotations}, {jt: name})
+def read_reference(lines):
+    index = defaultdict(Counter)
+    names = {}
+    for l in lines:
+        m = LINE_RE.match(l)
+        if not m: continue
+        key = (int(m.group(1)), int(m.group(2), 16))
+        text = m.group(3)
+
+        m = REF_RE.match(text)
+        if m:
+            kind, resident, jt, name, reg = m.groups()
+            jt = int(jt, 16)
+            if kind in ('PROC', 'ENTRY'):
+                index[key][(kind, jt)] += 1
+            else:
+                if reg and reg.upper() in ('A7', 'SP'): reg = 'sp' # as the listing spells it
+                index[key][(kind, bool(resident), jt, reg)] += 1
+            if name: names[jt] = name
+            continue
+
+        m = PATCH_RE.match(text)
+        if m:
+            index[key][('PATCH', int(m.group(1), 16), m.group(2))] += 1
+        elif ROM_RE.match(text):
+            index[key][('ROM', text)] += 1
+        elif CONDS_RE.match(text):
+            index[key][('CONDS', text)] += 1
+
+    return index, names
+
+
+# The same from a PatchSet. The reference, in jump table order, gives the conditions
+# of a resource only where it follows a module of another resource, so CONDS goes there.
+def annotations(ps):
+    index = defaultdict(Counter)
+    prev_num = None
+    for mjt, mod in sorted(ps.modtable.items()):
+        base = mod.ofs - ps.codeofs(mod.num)
+        ann = lambda ofs: index[(mod.num, base + ofs)]
+
+        if mod.num != prev_num:
+            ann(0)[('CONDS', ps.condstr(mod.num)[1:-1])] += 1
+        prev_num = mod.num
+        for i, ofs in enumerate([0] + mod.ents):
+            jt = mjt + i
+            ann(ofs)[('ENTRY', jt) if i else ('PROC', jt)] += 1
+            for trap, condbits in ps.jtpatches.get(jt, ()):
+                ann(ofs)[('PATCH', trap, ps.condstr(condbits))] += 1
+
+        for ofs, _, opcode, resident, targ_jt in mod.coderefs:
+            reg = 'A%d' % opcode if opcode < 7 else 'sp' if opcode == 7 else None
+            ann(ofs)[(OPCODES[opcode], resident, targ_jt, reg)] += 1
+
+        for start, length, _, romaddrs, _ in mod.romrefs:
+            ann(start + length - 4)[('ROM', ps.romaddrspec(romaddrs))] += 1
+
+    return index
+
+
+# List the differences, as lines like '31:00688: missing (jsr 003)'
+def compare(ps, reference, names):
+    got = annotations(ps)
+
+    mismatches = []
+    for key in sorted(reference.keys() | got.keys()):
+        want, have = reference.get(key, Counter()), got.get(key, Counter())
+        for ann in sorted((want - have).elements(), key=repr):
+            mismatches.append('%02d:%05x: missing %s' % (key + (_format(ann),)))
+        for ann in sorted((have - want).elements(), key=repr):
+            mismatches.append('%02d:%05x: unexpected %s' % (key + (_format(ann),)))
+
+    for jt, name in sorted(names.items()):
+        linker_name = ps.namedb.get(jt, [None])[0]
+        if linker_name and linker_name.upper() != name.upper():
+            mismatches.append('%03X: named %s, not %s' % (jt, linker_name, name))
+
+    return mismatches
+
+
+# An annotation as it appears in the reference
+def _format(ann, name=None):
+    name = ' ' + name if name else ''
+    if ann[0] in ('CONDS', 'ROM'):
+        return ann[1]
+    elif ann[0] == 'PATCH':
+        return '$%X,%s' % ann[1:]
+    elif ann[0] in ('PROC', 'ENTRY'):
+        return '(%s %03X%s)' % (ann[0], ann[1], name)
+    else:
+        opcode, resident, jt, reg = ann
+        return '(%s%s %03X%s%s)' % (opcode, 'Resident' * resident, jt, name, ',' + reg if reg else '')
+
+
+# Write the annotations of a PatchSet in the reference format, for a new reference
+def write_reference(ps, file=None):
+    write = (file or sys.stdout).write
+    for (num, ofs), anns in sorted(annotations(ps).items()):
+        for ann in sorted(anns.elements(), key=_reference_order):
+            if ann[0] == 'PROC' or ann[0] in OPCODES:
+                jt = ann[1] if ann[0] == 'PROC' else ann[2]
+                name = ps.namedb.get(jt, [None])[0]
+            else:
+                name = None
+            write('%02d:%05x: %s\n' % (num, ofs, _format(ann, name)))
+
+
+# Module header lines first, as in definitive.txt
+def _reference_order(ann):
+    return (['CONDS', 'PROC', 'ENTRY', 'PATCH'] + OPCODES + ['ROM']).index(ann[0]), repr(ann)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='''
+        Compare the PROC/ENTRY/jsr/lea/dcImport/ROM annotations of lpch or gpch resources
+        with a reference dump like definitive.txt, by resource and offset.
+    ''')
+    parser.add_argument('reference', action='store', help='reference dump (written with --write)')
+    parser.add_argument('src', nargs='+', action='store', metavar='[System | System//lpch | System//gpch/N]')
+    parser.add_argument('--gpch', action='store', type=int, metavar='N', help='which gpch to check from a System file')
+    parser.add_argument('-l', action='store', help='text file with module names (from LinkedPatch -l), to check names too')
+    parser.add_argument('--write', action='store_true', help='write the reference from src instead of checking it')
+    args = parser.parse_args()
+
+    ps = lpch.parse_files(args.src, args.gpch)
+
+    if args.l:
+        lpch.read_linker_names(ps, args.l)
+
+    if args.write:
+        with open(args.reference, 'w') as f:
+            write_reference(ps, f)
+        sys.exit(0)
+
+    with open(args.reference) as f:
+        reference, names = read_reference(f)
+
+    mismatches = compare(ps, reference, names)
+    for l in mismatches: print(l)
+    print('%d annotations checked, %d mismatches' % (sum(sum(c.values()) for c in reference.values()), len(mismatches)), file=sys.stderr)
+    sys.exit(1 if mismatches else 0)